@@ -13,6 +13,7 @@ COMPLETE FEATURES:
 - Proper error handling and cleanup
 """
 
+import importlib.util
 import json
 import logging
 import os
@@ -21,10 +22,13 @@ import re
 import subprocess
 import sys
 import time
+import zipfile
 from pathlib import Path
-from typing import List, Dict, Optional, Set
+from itertools import islice
+from typing import Iterable, List, Dict, Optional, Set
 from urllib.parse import quote_plus
 from datetime import datetime
+from xml.sax.saxutils import escape as xml_escape
 import requests
 
 # Configure logging
@@ -32,21 +36,20 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 def install_dependencies():
-    """Install required packages."""
-    required = ['selenium', 'webdriver-manager', 'openpyxl', 'requests']
-    for package in required:
-        try:
-            if package == 'webdriver-manager':
-                import webdriver_manager
-            elif package == 'openpyxl':
-                import openpyxl
-            elif package == 'requests':
-                import requests
-            else:
-                __import__(package)
-        except ImportError:
-            print(f"Installing {package}...")
-            subprocess.call([sys.executable, "-m", "pip", "install", package])
+    """Install required packages that are missing."""
+    if os.environ.get('SKIP_DEP_INSTALL'):
+        return
+    
+    # find_spec only locates the package, so nothing is imported here
+    required = [('selenium', 'selenium'), ('webdriver-manager', 'webdriver_manager'),
+                ('openpyxl', 'openpyxl'), ('requests', 'requests')]
+    missing = [package for package, module in required
+               if importlib.util.find_spec(module) is None]
+    if not missing:
+        return
+    
+    print(f"Installing {', '.join(missing)}...")
+    subprocess.call([sys.executable, "-m", "pip", "install", *missing])
 
 install_dependencies()
 
@@ -59,13 +62,224 @@ try:
     from selenium.webdriver.support import expected_conditions as EC
     from selenium.common.exceptions import TimeoutException, NoSuchElementException
     from webdriver_manager.chrome import ChromeDriverManager
-    import openpyxl
-    from openpyxl.styles import Font, PatternFill, Alignment
     import requests
 except ImportError as e:
     print(f"Failed to import required packages: {e}")
     sys.exit(1)
 
+# orjson is optional; it serialises candidate lists much faster than json
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def _pick_opener():
+    """Return a callable that opens a file with the platform's default app."""
+    if sys.platform == 'win32':
+        return os.startfile
+    elif sys.platform == 'darwin':
+        return lambda path: subprocess.call(['open', path])
+    else:
+        return lambda path: subprocess.call(['xdg-open', path])
+
+def _spawn_script(path):
+    """Launch a Python script with posix_spawn, falling back to Popen.
+    
+    posix_spawn does not copy the parent's address space the way fork()
+    does, so launching stays fast while the browser driver is loaded.
+    """
+    args = [sys.executable, str(path)]
+    try:
+        os.posix_spawn(sys.executable, args, os.environ)
+    except (AttributeError, OSError):
+        subprocess.Popen(args)
+
+def _pick_script_launcher():
+    """Return a callable that launches a Python script in its own process."""
+    if sys.platform == 'win32':
+        return lambda path: subprocess.Popen([sys.executable, str(path)],
+                                             creationflags=subprocess.CREATE_NEW_CONSOLE)
+    else:
+        return _spawn_script
+
+OPEN_FILE = _pick_opener()
+LAUNCH_SCRIPT = _pick_script_launcher()
+
+# Accepted answers for y/n prompts (an empty answer means yes where allowed)
+_YES = frozenset({'y', 'yes'})
+_YES_DEFAULT = _YES | {''}
+_NO = frozenset({'n', 'no'})
+
+# Reports with more rows than this skip openpyxl and use _fast_excel_write
+FAST_EXCEL_THRESHOLD = 500
+# Write buffer for Excel output, so saving takes far fewer write() syscalls
+EXCEL_WRITE_BUFFER = 1 << 20
+
+# Cell style indexes into XLSX_STYLES (cellXfs order)
+XLSX_STYLE_DEFAULT = 0
+XLSX_STYLE_HEADER = 1
+XLSX_STYLE_LINK = 2
+XLSX_STYLE_DOMAIN = 3
+
+XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
+)
+XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    '</Relationships>'
+)
+XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{title}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+# Same colours as the openpyxl styles in _write_excel_openpyxl
+XLSX_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="3">'
+    '<font><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><color rgb="FFFFFFFF"/><name val="Calibri"/></font>'
+    '<font><u/><sz val="11"/><color rgb="FF0000FF"/><name val="Calibri"/></font>'
+    '</fonts>'
+    '<fills count="4">'
+    '<fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="FF4472C4"/><bgColor rgb="FF4472C4"/></patternFill></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="FFE6F3FF"/><bgColor rgb="FFE6F3FF"/></patternFill></fill>'
+    '</fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="4">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="2" borderId="0" xfId="0" applyFont="1" applyFill="1" applyAlignment="1">'
+    '<alignment horizontal="center"/></xf>'
+    '<xf numFmtId="0" fontId="2" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+    '<xf numFmtId="0" fontId="0" fillId="3" borderId="0" xfId="0" applyFill="1"/>'
+    '</cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '<dxfs count="3">'
+    '<dxf><fill><patternFill patternType="solid"><fgColor rgb="FFC6EFCE"/><bgColor rgb="FFC6EFCE"/></patternFill></fill></dxf>'
+    '<dxf><fill><patternFill patternType="solid"><fgColor rgb="FFFFEB9C"/><bgColor rgb="FFFFEB9C"/></patternFill></fill></dxf>'
+    '<dxf><fill><patternFill patternType="solid"><fgColor rgb="FFFFC7CE"/><bgColor rgb="FFFFC7CE"/></patternFill></fill></dxf>'
+    '</dxfs>'
+    '</styleSheet>'
+)
+# Confidence colouring as conditional formatting rules using the dxfs above
+XLSX_CONF_RULES = (
+    '<conditionalFormatting sqref="{sqref}">'
+    '<cfRule type="cellIs" dxfId="0" priority="1" operator="equal"><formula>"High"</formula></cfRule>'
+    '<cfRule type="cellIs" dxfId="1" priority="2" operator="equal"><formula>"Medium"</formula></cfRule>'
+    '<cfRule type="expression" dxfId="2" priority="3">'
+    '<formula>AND({first}&lt;&gt;"",{first}&lt;&gt;"High",{first}&lt;&gt;"Medium")</formula></cfRule>'
+    '</conditionalFormatting>'
+)
+XLSX_ILLEGAL_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+def _column_letter(col: int) -> str:
+    """Convert a 1-based column index to its Excel letter (1 -> A, 27 -> AA)."""
+    letters = ''
+    while col:
+        col, remainder = divmod(col - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+def _fast_excel_write(path: str, sheet_title: str, rows: List[List[tuple]], widths: List[float],
+                      conditional_formatting: str = ''):
+    """Write a single-sheet XLSX file directly, without openpyxl.
+    
+    Each row is a list of (text, style) pairs where style is one of the
+    XLSX_STYLE_* indexes. Cells styled as XLSX_STYLE_LINK become hyperlinks
+    to their own text. Values are written as inline strings.
+    conditional_formatting is raw XML placed after the sheet data.
+    """
+    letters = [_column_letter(col) for col in range(1, len(widths) + 1)]
+    hyperlinks = []
+    
+    with open(path, 'wb', buffering=EXCEL_WRITE_BUFFER) as f, \
+            zipfile.ZipFile(f, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('[Content_Types].xml', XLSX_CONTENT_TYPES)
+        zf.writestr('_rels/.rels', XLSX_ROOT_RELS)
+        zf.writestr('xl/_rels/workbook.xml.rels', XLSX_WORKBOOK_RELS)
+        zf.writestr('xl/workbook.xml', XLSX_WORKBOOK.format(title=xml_escape(sheet_title, {'"': '&quot;'})))
+        zf.writestr('xl/styles.xml', XLSX_STYLES)
+        
+        with zf.open('xl/worksheets/sheet1.xml', 'w') as sheet:
+            parts = [
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+                'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"><cols>'
+            ]
+            for col, width in enumerate(widths, 1):
+                parts.append(f'<col min="{col}" max="{col}" width="{width}" customWidth="1"/>')
+            parts.append('</cols><sheetData>')
+            sheet.write(''.join(parts).encode('utf-8'))
+            
+            for row_number, row in enumerate(rows, 1):
+                parts = [f'<row r="{row_number}">']
+                for letter, (text, style) in zip(letters, row):
+                    ref = f'{letter}{row_number}'
+                    if text:
+                        text = XLSX_ILLEGAL_CHARS.sub('', text)
+                        parts.append(f'<c r="{ref}" s="{style}" t="inlineStr"><is>'
+                                     f'<t xml:space="preserve">{xml_escape(text)}</t></is></c>')
+                        if style == XLSX_STYLE_LINK:
+                            hyperlinks.append((ref, text))
+                    elif style:
+                        parts.append(f'<c r="{ref}" s="{style}"/>')
+                parts.append('</row>')
+                sheet.write(''.join(parts).encode('utf-8'))
+            
+            parts = ['</sheetData>', conditional_formatting]
+            if hyperlinks:
+                parts.append('<hyperlinks>')
+                for i, (ref, _) in enumerate(hyperlinks, 1):
+                    parts.append(f'<hyperlink ref="{ref}" r:id="rId{i}"/>')
+                parts.append('</hyperlinks>')
+            parts.append('</worksheet>')
+            sheet.write(''.join(parts).encode('utf-8'))
+        
+        if hyperlinks:
+            parts = [
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            ]
+            for i, (_, target) in enumerate(hyperlinks, 1):
+                parts.append(f'<Relationship Id="rId{i}" '
+                             'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink" '
+                             f'Target="{xml_escape(target, {chr(34): "&quot;"})}" TargetMode="External"/>')
+            parts.append('</Relationships>')
+            zf.writestr('xl/worksheets/_rels/sheet1.xml.rels', ''.join(parts))
+
 class LinkedInSearxSearcher:
     """LinkedIn searcher using Searx instead of Bing with full interactive workflow."""
     
@@ -76,6 +290,11 @@ class LinkedInSearxSearcher:
         self.found_candidates = []
         self.processed_urls = set()
         
+        # Profiles are streamed here as they are found so a crash mid-run
+        # does not lose them; save_results still writes the final JSON
+        self.stream_file = 'linkedin_candidates.jsonl'
+        self.candidate_stream = None
+        
         # Searx configuration
         self.primary_searx = "https://priv.au"
         self.backup_searx = ["https://searx.be", "https://search.privacyguides.net"]
@@ -181,9 +400,9 @@ class LinkedInSearxSearcher:
         
         while True:
             choice = input("\nProceed with Searx LinkedIn search? (y/n): ").strip().lower()
-            if choice in ['y', 'yes', '']:
+            if choice in _YES_DEFAULT:
                 return True
-            elif choice in ['n', 'no']:
+            elif choice in _NO:
                 print("❌ Search cancelled.")
                 return False
             else:
@@ -224,22 +443,24 @@ class LinkedInSearxSearcher:
         
         while True:
             choice = input("\nStart Searx LinkedIn search? (y/n): ").strip().lower()
-            if choice in ['y', 'yes', '']:
+            if choice in _YES_DEFAULT:
                 return True
-            elif choice in ['n', 'no']:
+            elif choice in _NO:
                 print("❌ Search cancelled.")
                 return False
             else:
                 print("Please enter 'y' for yes or 'n' for no.")
     
     def create_searx_queries(self):
-        """Create search queries using exact Searx X-ray syntax."""
+        """Yield search queries using exact Searx X-ray syntax.
+        
+        Queries are generated lazily so the search loop can start issuing
+        requests straight away and stop early once it has enough results.
+        """
         company = self.config.get('company_name', '').lower()
         location = self.config.get('location', '').lower()
         job_titles = self.config.get('job_titles', [])
         
-        queries = []
-        
         # Domain path for search
         domain_path = f"{self.target_domain}/in/"
         
@@ -249,84 +470,78 @@ class LinkedInSearxSearcher:
             # Job title specific searches using your exact syntax
             for title in job_titles:
                 title_lower = title.lower()
-                title_queries = [
-                    f'"{domain_path}" {location} {company} {title_lower}',
-                    f'"{domain_path}" {company} {title_lower} {location}',
-                    f'"{domain_path}" {company} {title_lower}'  # Without location as backup
-                ]
-                queries.extend(title_queries)
+                yield f'"{domain_path}" {location} {company} {title_lower}'
+                yield f'"{domain_path}" {company} {title_lower} {location}'
+                yield f'"{domain_path}" {company} {title_lower}'  # Without location as backup
             
             # Add general executive queries
-            exec_queries = [
-                f'"{domain_path}" {location} {company} director',
-                f'"{domain_path}" {location} {company} manager',
-                f'"{domain_path}" {location} {company} sales',
-                f'"{domain_path}" {company} director {location}',
-                f'"{domain_path}" {company} manager {location}',
-                f'"{domain_path}" {location} {company}'  # General fallback
-            ]
-            queries.extend(exec_queries)
+            yield f'"{domain_path}" {location} {company} director'
+            yield f'"{domain_path}" {location} {company} manager'
+            yield f'"{domain_path}" {location} {company} sales'
+            yield f'"{domain_path}" {company} director {location}'
+            yield f'"{domain_path}" {company} manager {location}'
+            yield f'"{domain_path}" {location} {company}'  # General fallback
             
             # Add global backup searches (linkedin.com instead of country-specific)
             if self.target_domain != 'linkedin.com':
-                global_queries = [
-                    f'"linkedin.com/in/" {location} {company} sales',
-                    f'"linkedin.com/in/" {company} director {location}',
-                    f'"linkedin.com/in/" {location} {company}'
-                ]
-                queries.extend(global_queries)
+                yield f'"linkedin.com/in/" {location} {company} sales'
+                yield f'"linkedin.com/in/" {company} director {location}'
+                yield f'"linkedin.com/in/" {location} {company}'
             
         else:
             logger.info(f"Creating general company searches...")
             
             # General company searches using your syntax
-            queries = [
-                f'"{domain_path}" {location} {company}',
-                f'"{domain_path}" {company} {location}',
-                f'"{domain_path}" {company} sales {location}',
-                f'"{domain_path}" {company} director {location}',
-                f'"{domain_path}" {company} manager {location}',
-                f'"{domain_path}" {company}'  # Broadest search
-            ]
+            yield f'"{domain_path}" {location} {company}'
+            yield f'"{domain_path}" {company} {location}'
+            yield f'"{domain_path}" {company} sales {location}'
+            yield f'"{domain_path}" {company} director {location}'
+            yield f'"{domain_path}" {company} manager {location}'
+            yield f'"{domain_path}" {company}'  # Broadest search
             
             # Add global backup
             if self.target_domain != 'linkedin.com':
-                queries.extend([
-                    f'"linkedin.com/in/" {location} {company}',
-                    f'"linkedin.com/in/" {company} {location}'
-                ])
-        
-        logger.info(f"Created {len(queries)} Searx search queries")
-        return queries
+                yield f'"linkedin.com/in/" {location} {company}'
+                yield f'"linkedin.com/in/" {company} {location}'
     
     def search_profiles_via_searx(self):
         """Main search function using Searx API and browser fallback."""
-        queries = self.create_searx_queries()
-        
         print(f"\n🔍 Starting Searx LinkedIn search...")
         print(f"Using: {self.working_searx}")
         print("=" * 60)
         
-        # Try API method first (faster)
-        api_profiles = self._search_via_api(queries)
-        
-        if api_profiles:
-            self.found_candidates.extend(api_profiles)
-            print(f"✅ API search completed: {len(api_profiles)} profiles")
-        else:
-            print("⚠️ API search failed, trying browser method...")
-            browser_profiles = self._search_via_browser(queries)
-            self.found_candidates.extend(browser_profiles)
+        # Binary and unbuffered: each profile is one UTF-8 line written straight through
+        self.candidate_stream = open(self.stream_file, 'wb', buffering=0)
+        try:
+            # Try API method first (faster)
+            api_profiles = self._search_via_api(self.create_searx_queries())
+            
+            if api_profiles:
+                self.found_candidates.extend(api_profiles)
+                print(f"✅ API search completed: {len(api_profiles)} profiles")
+            else:
+                print("⚠️ API search failed, trying browser method...")
+                browser_profiles = self._search_via_browser(self.create_searx_queries())
+                self.found_candidates.extend(browser_profiles)
+        finally:
+            self._close_candidate_stream()
         
         print(f"\n🎉 Searx search completed! Found {len(self.found_candidates)} total profiles")
         return self.found_candidates
     
-    def _search_via_api(self, queries: List[str]) -> List[Dict]:
+    def _search_via_api(self, queries: Iterable[str]) -> List[Dict]:
         """Search using Searx JSON API."""
         profiles = []
+        max_candidates = self.config.get('max_candidates', 10_000)
+        query_count = 0
         
         for i, query in enumerate(queries, 1):
-            print(f"[{i}/{len(queries)}] API Search: {query[:60]}...")
+            if len(profiles) >= max_candidates:
+                print(f"  ✅ Reached {max_candidates} profiles, skipping remaining queries")
+                break
+            
+            query_count = i
+            print(f"[{i}] API Search: {query[:60]}...")
             
             try:
                 params = {
@@ -344,7 +559,14 @@ class LinkedInSearxSearcher:
                 )
                 
                 if response.status_code == 200:
-                    data = response.json()
+                    # Skip decoding payloads that cannot contain a profile URL
+                    raw = response.content
+                    if b"linkedin.com/in/" not in raw.lower():
+                        print("  ✅ Found 0 total, 0 new")
+                        time.sleep(1)
+                        continue
+                    
+                    data = json.loads(raw)
                     query_profiles = self._extract_profiles_from_json(data, query)
                     
                     new_profiles = [p for p in query_profiles if p['linkedin_url'] not in self.processed_urls]
@@ -352,6 +574,7 @@ class LinkedInSearxSearcher:
                     
                     for profile in new_profiles:
                         self.processed_urls.add(profile['linkedin_url'])
+                        self._stream_candidate(profile)
                     
                     print(f"  ✅ Found {len(query_profiles)} total, {len(new_profiles)} new")
                 else:
@@ -363,8 +586,23 @@ class LinkedInSearxSearcher:
                 print(f"  ❌ API error: {e}")
                 continue
         
+        logger.info(f"Ran {query_count} Searx search queries")
         return profiles
     
+    def _stream_candidate(self, profile: Dict):
+        """Append a newly found profile to the JSONL stream file."""
+        if self.candidate_stream:
+            self.candidate_stream.write(_json_dumps(profile) + b'\n')
+    
+    def _close_candidate_stream(self):
+        """Close the JSONL stream file if it is open."""
+        if self.candidate_stream:
+            try:
+                self.candidate_stream.close()
+            except Exception:
+                pass
+            self.candidate_stream = None
+    
     def _extract_profiles_from_json(self, data: dict, query: str) -> List[Dict]:
         """Extract LinkedIn profiles from Searx JSON response."""
         profiles = []
@@ -372,6 +610,12 @@ class LinkedInSearxSearcher:
         try:
             results = data.get("results", [])
             
+            # Values shared by every profile from this response
+            company_name = self.config.get('company_name', '')
+            location = self.config.get('location', '')
+            source = f'Searx Search ({self.working_searx})'
+            extraction_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            
             for result in results:
                 url = result.get("url", "")
                 title = result.get("title", "")
@@ -389,13 +633,13 @@ class LinkedInSearxSearcher:
                             'title': self._extract_job_title(title, content),
                             'link': url,  # Use 'link' for compatibility with other scripts
                             'linkedin_url': url,
-                            'company_name': self.config.get('company_name', ''),
-                            'location': self.config.get('location', ''),
+                            'company_name': company_name,
+                            'location': location,
                             'confidence': self._determine_confidence(title, content, query),
-                            'source': f'Searx Search ({self.working_searx})',
+                            'source': source,
                             'linkedin_domain': self._extract_domain_from_url(url),
                             'search_query': query,
-                            'extraction_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                            'extraction_date': extraction_date
                         }
                         profiles.append(profile)
         
@@ -404,7 +648,7 @@ class LinkedInSearxSearcher:
         
         return profiles
     
-    def _search_via_browser(self, queries: List[str]) -> List[Dict]:
+    def _search_via_browser(self, queries: Iterable[str]) -> List[Dict]:
         """Fallback browser search if API fails."""
         profiles = []
         
@@ -419,7 +663,12 @@ class LinkedInSearxSearcher:
             service = Service(ChromeDriverManager().install())
             self.driver = webdriver.Chrome(service=service, options=options)
             
-            for i, query in enumerate(queries[:8], 1):  # Limit browser searches
+            # Values shared by every profile found in the browser
+            company_name = self.config.get('company_name', '')
+            location = self.config.get('location', '')
+            source = f'Searx Browser ({self.working_searx})'
+            
+            for i, query in enumerate(islice(queries, 8), 1):  # Limit browser searches
                 print(f"[{i}/8] Browser Search: {query[:60]}...")
                 
                 try:
@@ -430,6 +679,7 @@ class LinkedInSearxSearcher:
                     # Extract LinkedIn URLs from page
                     page_source = self.driver.page_source
                     linkedin_urls = self._extract_linkedin_urls_from_page(page_source)
+                    extraction_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                     
                     for url in linkedin_urls:
                         if url not in self.processed_urls:
@@ -442,16 +692,17 @@ class LinkedInSearxSearcher:
                                 'title': 'LinkedIn Profile',
                                 'link': url,
                                 'linkedin_url': url,
-                                'company_name': self.config.get('company_name', ''),
-                                'location': self.config.get('location', ''),
+                                'company_name': company_name,
+                                'location': location,
                                 'confidence': 'medium',
-                                'source': f'Searx Browser ({self.working_searx})',
+                                'source': source,
                                 'linkedin_domain': self._extract_domain_from_url(url),
                                 'search_query': query,
-                                'extraction_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                                'extraction_date': extraction_date
                             }
                             profiles.append(profile)
                             self.processed_urls.add(url)
+                            self._stream_candidate(profile)
                     
                     print(f"  ✅ Found {len(linkedin_urls)} LinkedIn URLs")
                     time.sleep(3)
@@ -514,7 +765,7 @@ class LinkedInSearxSearcher:
         """Validate if a string could be a name part."""
         if not name or len(name) < 2 or len(name) > 20:
             return False
-        if not re.match(r'^[a-zA-Z]+$', name):
+        if not (name.isascii() and name.isalpha()):
             return False
         # Exclude obvious non-names
         excluded = {'linkedin', 'profile', 'www', 'http', 'https', 'com', 'org'}
@@ -545,13 +796,17 @@ class LinkedInSearxSearcher:
         """Validate name part."""
         if not name or len(name) < 2 or len(name) > 25:
             return False
-        if not re.match(r"^[a-zA-Z\-']+$", name):
-            return False
         
         false_positives = {
             'linkedin', 'profile', 'company', 'limited', 'group',
             'director', 'manager', 'executive', 'president'
         }
+        
+        # Plain ASCII letters (optionally with - or ') skip the regex engine
+        if name.isascii() and name.replace('-', '').replace("'", '').isalpha():
+            return name.lower() not in false_positives
+        if not re.match(r"^[a-zA-Z\-']+$", name):
+            return False
         return name.lower() not in false_positives
     
     def _extract_job_title(self, title: str, content: str) -> str:
@@ -575,17 +830,20 @@ class LinkedInSearxSearcher:
         """Determine confidence level."""
         score = 0
         company = self.config.get('company_name', '').lower()
+        title_lc = title.lower()
+        content_lc = content.lower()
         
         # Company name presence
-        if company in title.lower():
+        if company in title_lc:
             score += 3
-        if company in content.lower():
+        if company in content_lc:
             score += 2
         
         # Job title matching
         job_titles = self.config.get('job_titles', [])
         for job_title in job_titles:
-            if job_title.lower() in title.lower() or job_title.lower() in content.lower():
+            job_title_lc = job_title.lower()
+            if job_title_lc in title_lc or job_title_lc in content_lc:
                 score += 3
                 break
         
@@ -595,7 +853,7 @@ class LinkedInSearxSearcher:
         
         # Location matching
         location = self.config.get('location', '').lower()
-        if location in title.lower() or location in content.lower():
+        if location in title_lc or location in content_lc:
             score += 1
         
         if score >= 6:
@@ -682,8 +940,7 @@ class LinkedInSearxSearcher:
         try:
             # Save in the same format as other scripts for compatibility
             output_file = 'linkedin_candidates.json'
-            with open(output_file, 'w') as f:
-                json.dump(self.found_candidates, f, indent=4)
+            Path(output_file).write_bytes(_json_dumps(self.found_candidates))
             
             print(f"💾 Results saved to {output_file}")
             return True
@@ -696,79 +953,39 @@ class LinkedInSearxSearcher:
         try:
             print("📊 Creating Searx Excel report...")
             
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "Searx LinkedIn Profiles"
-            
             # Headers
             headers = ["First Name", "Last Name", "Job Title", "LinkedIn URL", "LinkedIn Domain", 
                       "Company", "Location", "Confidence", "Source"]
             
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col, value=header)
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-                cell.alignment = Alignment(horizontal="center")
-            
-            # Data
-            for row, candidate in enumerate(self.found_candidates, 2):
-                ws.cell(row=row, column=1, value=candidate.get('first_name', ''))
-                ws.cell(row=row, column=2, value=candidate.get('last_name', ''))
-                ws.cell(row=row, column=3, value=candidate.get('title', ''))
-                
-                # LinkedIn URL with hyperlink
-                url_cell = ws.cell(row=row, column=4, value=candidate.get('linkedin_url', ''))
-                if candidate.get('linkedin_url'):
-                    url_cell.hyperlink = candidate['linkedin_url']
-                    url_cell.font = Font(color="0000FF", underline="single")
-                
-                # Domain highlighting
-                domain_cell = ws.cell(row=row, column=5, value=candidate.get('linkedin_domain', ''))
-                if candidate.get('linkedin_domain') != 'linkedin.com':
-                    domain_cell.fill = PatternFill(start_color="E6F3FF", end_color="E6F3FF", fill_type="solid")
-                
-                ws.cell(row=row, column=6, value=candidate.get('company_name', ''))
-                ws.cell(row=row, column=7, value=candidate.get('location', ''))
-                
-                # Confidence with color
-                conf_cell = ws.cell(row=row, column=8, value=candidate.get('confidence', '').title())
-                if conf_cell.value == 'High':
-                    conf_cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-                elif conf_cell.value == 'Medium':
-                    conf_cell.fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-                else:
-                    conf_cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-                
-                ws.cell(row=row, column=9, value=candidate.get('source', ''))
+            # Flatten candidates into row tuples once; both writers emit from these
+            rows = [
+                (c.get('first_name') or '', c.get('last_name') or '', c.get('title') or '',
+                 c.get('linkedin_url') or '', c.get('linkedin_domain') or '',
+                 c.get('company_name') or '', c.get('location') or '',
+                 (c.get('confidence') or '').title(), c.get('source') or '')
+                for c in self.found_candidates
+            ]
             
-            # Adjust column widths
-            for col in ws.columns:
-                max_length = 0
-                column = col[0].column_letter
-                for cell in col:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                ws.column_dimensions[column].width = min(max_length + 2, 60)
+            # Both writers need the column widths before the first row is written
+            columns = list(zip(*rows)) or [()] * len(headers)
+            widths = [min(max(len(header), max(map(len, column), default=0)) + 2, 60)
+                      for header, column in zip(headers, columns)]
             
             # Save file
             company = self.config.get('company_name', 'Company').replace(' ', '_')
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"{company}_Searx_LinkedIn_{timestamp}.xlsx"
-            wb.save(filename)
+            
+            if len(rows) > FAST_EXCEL_THRESHOLD:
+                self._write_excel_fast(filename, headers, rows, widths)
+            else:
+                self._write_excel_openpyxl(filename, headers, rows, widths)
             
             print(f"✅ Searx Excel report created: {filename}")
             
             # Try to open
             try:
-                if sys.platform == 'win32':
-                    os.startfile(filename)
-                elif sys.platform == 'darwin':
-                    subprocess.call(['open', filename])
-                else:
-                    subprocess.call(['xdg-open', filename])
+                OPEN_FILE(filename)
                 print("📂 File opened automatically")
             except:
                 print(f"📂 Please open manually: {filename}")
@@ -779,6 +996,97 @@ class LinkedInSearxSearcher:
             print(f"❌ Searx Excel creation error: {e}")
             return False
     
+    def _write_excel_openpyxl(self, filename: str, headers: List[str], rows: List[tuple], widths: List[float]):
+        """Write the Excel report through openpyxl."""
+        # openpyxl is only imported when a report is actually written
+        import openpyxl
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.formatting.rule import CellIsRule, FormulaRule
+        from openpyxl.styles import Font, PatternFill, Alignment
+        from openpyxl.utils import get_column_letter
+        
+        # Styles are shared by every cell that uses them (colours are ARGB)
+        header_font = Font(bold=True, color="FFFFFFFF")
+        header_fill = PatternFill(start_color="FF4472C4", end_color="FF4472C4", fill_type="solid")
+        header_alignment = Alignment(horizontal="center")
+        link_font = Font(color="FF0000FF", underline="single")
+        domain_fill = PatternFill(start_color="FFE6F3FF", end_color="FFE6F3FF", fill_type="solid")
+        high_fill = PatternFill(start_color="FFC6EFCE", end_color="FFC6EFCE", fill_type="solid")
+        medium_fill = PatternFill(start_color="FFFFEB9C", end_color="FFFFEB9C", fill_type="solid")
+        low_fill = PatternFill(start_color="FFFFC7CE", end_color="FFFFC7CE", fill_type="solid")
+        
+        # Write-only mode streams rows to disk instead of keeping every cell in memory
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("Searx LinkedIn Profiles")
+        
+        for col, width in enumerate(widths, 1):
+            ws.column_dimensions[get_column_letter(col)].width = width
+        
+        header_row = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = header_alignment
+            header_row.append(cell)
+        ws.append(header_row)
+        
+        # Data
+        for first_name, last_name, title, url, domain, company, location, confidence, source in rows:
+            # LinkedIn URL with hyperlink
+            url_cell = WriteOnlyCell(ws, value=url)
+            if url:
+                url_cell.hyperlink = url
+                url_cell.font = link_font
+            
+            # Domain highlighting
+            domain_cell = WriteOnlyCell(ws, value=domain)
+            if domain != 'linkedin.com':
+                domain_cell.fill = domain_fill
+            
+            ws.append([first_name, last_name, title, url_cell, domain_cell,
+                       company, location, confidence, source])
+        
+        # Confidence colours are applied by Excel through conditional formatting
+        if rows:
+            conf_column = get_column_letter(headers.index("Confidence") + 1)
+            first = f'{conf_column}2'
+            conf_range = f'{first}:{conf_column}{len(rows) + 1}'
+            ws.conditional_formatting.add(
+                conf_range, CellIsRule(operator='equal', formula=['"High"'], fill=high_fill))
+            ws.conditional_formatting.add(
+                conf_range, CellIsRule(operator='equal', formula=['"Medium"'], fill=medium_fill))
+            ws.conditional_formatting.add(
+                conf_range, FormulaRule(formula=[f'AND({first}<>"",{first}<>"High",{first}<>"Medium")'],
+                                        fill=low_fill))
+        
+        with open(filename, 'wb', buffering=EXCEL_WRITE_BUFFER) as f:
+            wb.save(f)
+    
+    def _write_excel_fast(self, filename: str, headers: List[str], rows: List[tuple], widths: List[float]):
+        """Write the Excel report with the raw XLSX writer (large result sets)."""
+        styled_rows = [[(header, XLSX_STYLE_HEADER) for header in headers]]
+        for first_name, last_name, title, url, domain, company, location, confidence, source in rows:
+            styled_rows.append([
+                (first_name, XLSX_STYLE_DEFAULT),
+                (last_name, XLSX_STYLE_DEFAULT),
+                (title, XLSX_STYLE_DEFAULT),
+                (url, XLSX_STYLE_LINK if url else XLSX_STYLE_DEFAULT),
+                (domain, XLSX_STYLE_DOMAIN if domain != 'linkedin.com' else XLSX_STYLE_DEFAULT),
+                (company, XLSX_STYLE_DEFAULT),
+                (location, XLSX_STYLE_DEFAULT),
+                (confidence, XLSX_STYLE_DEFAULT),
+                (source, XLSX_STYLE_DEFAULT),
+            ])
+        
+        conditional_formatting = ''
+        if rows:
+            conf_column = _column_letter(headers.index("Confidence") + 1)
+            conditional_formatting = XLSX_CONF_RULES.format(
+                sqref=f'{conf_column}2:{conf_column}{len(rows) + 1}', first=f'{conf_column}2')
+        
+        _fast_excel_write(filename, "Searx LinkedIn Profiles", styled_rows, widths, conditional_formatting)
+    
     def offer_verification(self):
         """Offer to run LinkedIn verification."""
         if not self.found_candidates:
@@ -797,16 +1105,12 @@ class LinkedInSearxSearcher:
         
         while True:
             choice = input("\nLaunch LinkedIn verification now? (y/n): ").strip().lower()
-            if choice in ['y', 'yes']:
+            if choice in _YES:
                 verification_script = self.script_dir / "script5_linkedin_verification.py"
                 if verification_script.exists():
                     try:
                         print("🚀 Launching LinkedIn verification...")
-                        if sys.platform == 'win32':
-                            subprocess.Popen([sys.executable, str(verification_script)], 
-                                           creationflags=subprocess.CREATE_NEW_CONSOLE)
-                        else:
-                            subprocess.Popen([sys.executable, str(verification_script)])
+                        LAUNCH_SCRIPT(verification_script)
                         print("✅ Verification script launched!")
                         break
                     except Exception as e:
@@ -821,17 +1125,13 @@ class LinkedInSearxSearcher:
                         if alt_path.exists():
                             try:
                                 print(f"🚀 Found alternative verification script: {alt_script}")
-                                if sys.platform == 'win32':
-                                    subprocess.Popen([sys.executable, str(alt_path)], 
-                                                   creationflags=subprocess.CREATE_NEW_CONSOLE)
-                                else:
-                                    subprocess.Popen([sys.executable, str(alt_path)])
+                                LAUNCH_SCRIPT(alt_path)
                                 print("✅ Alternative verification script launched!")
                                 return
                             except Exception as e:
                                 print(f"❌ Error launching {alt_script}: {e}")
                     break
-            elif choice in ['n', 'no']:
+            elif choice in _NO:
                 print("ℹ️ Verification skipped. You can run it later.")
                 print("💡 Available verification scripts:")
                 print("   - script5_linkedin_verification.py")
@@ -842,6 +1142,7 @@ class LinkedInSearxSearcher:
     
     def cleanup(self):
         """Close browser and cleanup."""
+        self._close_candidate_stream()
         if self.driver:
             try:
                 self.driver.quit()
@@ -6,6 +6,7 @@ This script searches company websites for employee information
 with comprehensive filtering, job title targeting, and Excel generation.
 """
 
+import hashlib
 import json
 import logging
 import os
@@ -14,10 +15,13 @@ import re
 import subprocess
 import sys
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
 from pathlib import Path
-from typing import List, Dict, Optional, Set
+from typing import Iterator, List, Dict, Optional, Set, Tuple
 from urllib.parse import quote_plus, urlparse
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 
 # Configure logging
 logging.basicConfig(
@@ -29,7 +33,7 @@ logger = logging.getLogger(__name__)
 # Install dependencies if needed
 def install_dependencies():
     """Install required packages if not available."""
-    required_packages = ['selenium', 'webdriver-manager']
+    required_packages = ['selenium', 'webdriver-manager', 'requests']
     
     for package in required_packages:
         try:
@@ -55,11 +59,220 @@ try:
         WebDriverException, SessionNotCreatedException
     )
     from webdriver_manager.chrome import ChromeDriverManager
+    import requests
 except ImportError as e:
     logger.error(f"Failed to import Selenium: {e}")
     sys.exit(1)
 
-@dataclass
+# google-re2 is optional; its DFA matcher keeps the fused employee screen
+# linear in the text length however many patterns it contains
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# pyahocorasick is optional; it finds every title keyword in a single scan
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# orjson is optional; it serialises result lists much faster than json
+try:
+    import orjson
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Keywords used to infer a title from the text around a match, in priority order
+TITLE_KEYWORDS = {
+    'manager': 'Manager',
+    'director': 'Director',
+    'executive': 'Executive',
+    'officer': 'Officer',
+    'president': 'President',
+    'head': 'Head',
+    'lead': 'Lead',
+    'chief': 'Chief',
+    'senior': 'Senior',
+    'principal': 'Principal'
+}
+
+# Words in the surrounding text that suggest a genuine appointment
+_POSITIVE_INDICATORS = frozenset({'appointed', 'promoted', 'joins', 'joined', 'announces', 'welcomes'})
+
+# Title words that indicate a senior, relevant role
+_QUALITY_TITLES = frozenset({'director', 'manager', 'executive', 'officer', 'president', 'chief', 'head'})
+
+_WORD_RE = re.compile(r'[a-z]+')
+
+# Where the resolved ChromeDriver path is remembered between runs, and for how long
+CHROMEDRIVER_CACHE_FILE = Path.home() / '.cache' / 'boolean' / 'chromedriver_path.txt'
+CHROMEDRIVER_CACHE_TTL = 30 * 86400
+
+# Employee patterns that do not depend on the configured job titles
+EMPLOYEE_PATTERNS = (
+    # "appoints/names/promotes FirstName LastName as/to Title"
+    r'(?:appoints?|names?|promotes?|welcomes?|announces?)\s+([A-Z][a-z]+)\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?)\s+(?:as|to|as\s+the|to\s+the\s+position\s+of)\s+([^.]{5,50})',
+    
+    # "FirstName LastName, Title" or "FirstName LastName as Title"
+    r'([A-Z][a-z]+)\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?),?\s+(?:as\s+)?([^.,]{10,60}(?:Chief|Director|Manager|Officer|President|VP|Vice\s+President)[^.,]{0,20})',
+    
+    # "Title FirstName LastName" (when title comes first)
+    r'(?:Chief|Director|Manager|Officer|President|VP|Vice\s+President)\s+([A-Z][a-z]+)\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?)',
+    
+    # Look for patterns like "Brad Herring has been appointed"
+    r'([A-Z][a-z]+)\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?)\s+(?:has\s+been|was|is)\s+(?:appointed|named|promoted|hired)',
+    
+    # Job title specific patterns
+    r'([A-Z][a-z]+)\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?)\s+(?:joins|joined)\s+.*?(?:as|as\s+a|as\s+the)\s+([^.,]{5,50})',
+    
+    # Pattern for "John Smith is our new Property Manager"
+    r'([A-Z][a-z]+)\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?)\s+is\s+(?:our\s+)?(?:new\s+)?([^.,]{5,50}(?:Manager|Director|Officer|Executive|Analyst|Specialist)[^.,]{0,20})'
+)
+
+NAME_PART_RE = re.compile(r"[a-zA-Z\-']+")
+
+# Words that show an extracted "name" is really part of a business phrase
+BUSINESS_TERMS = frozenset({
+    'appoints', 'announces', 'welcomes', 'promotes', 'elevates', 'names',
+    'chief', 'officer', 'executive', 'financial', 'revenue', 'operating',
+    'strategy', 'technology', 'interim', 'board', 'chair', 'director',
+    'positions', 'hedge', 'fund', 'managers', 'portfolio', 'operations',
+    'leadership', 'general', 'terms', 'acquisition', 'clearwater', 
+    'analytics', 'finalizes', 'investor', 'quarter', 'press', 'release',
+    'client', 'success', 'traders', 'demo', 'back', 'build', 'nothing',
+    'move', 'learning', 'read', 'more', 'open', 'second', 'first',
+    'company', 'corporation', 'enterprise', 'group', 'holdings',
+    'management', 'development', 'consulting', 'services', 'solutions',
+    'keeps', 'your', 'office', 'enfusion', 'sustains', 'global'
+})
+
+# Title and phrase combinations that are not a person's name
+TITLE_COMBINATIONS = (
+    'chief executive', 'chief financial', 'chief technology', 'chief operating',
+    'executive officer', 'financial officer', 'technology officer', 'operating officer',
+    'vice president', 'board chair', 'board member', 'managing director',
+    'keeps your', 'back office', 'enfusion names', 'enfusion announces',
+    'enfusion sustains', 'global growth'
+)
+TITLE_COMBINATION_RE = re.compile('|'.join(map(re.escape, TITLE_COMBINATIONS)))
+# The "First Last" pair every employee pattern contains; case-insensitive like the patterns
+NAME_BIGRAM_RE = re.compile(r'[A-Z][a-z]+\s+[A-Z][a-z]+', re.IGNORECASE)
+TITLE_PREFIX_RE = re.compile(r'^(as\s+|to\s+|the\s+)', re.IGNORECASE)
+
+# Page text that means the search engine is blocking automated queries
+BLOCKING_TERMS = ('captcha', 'unusual traffic', 'automated queries')
+
+def is_blocked_page(html: str) -> bool:
+    """Check whether a results page is a block or CAPTCHA page rather than results."""
+    html_lower = html.lower()
+    return 'b_algo' not in html_lower and any(term in html_lower for term in BLOCKING_TERMS)
+
+class BingResultsParser(HTMLParser):
+    """Collect (title, link, description) for each li.b_algo block of a Bing results page.
+    
+    Mirrors what the Selenium path reads: the text and href of the first
+    'h2 a' and the text of the first paragraph inside '.b_caption'.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.results: List[Tuple[str, str, str]] = []
+        self._result = None
+        self._li_depth = 0
+        self._in_h2 = False
+        self._in_title_link = False
+        self._caption_tag = None
+        self._caption_depth = 0
+        self._in_caption_p = False
+    
+    def handle_starttag(self, tag, attrs):
+        attributes = dict(attrs)
+        classes = (attributes.get('class') or '').split()
+        
+        if self._result is None:
+            if tag == 'li' and 'b_algo' in classes:
+                self._result = {'title': [], 'link': None, 'description': [], 'has_description': False}
+                self._li_depth = 1
+            return
+        
+        if tag == 'br':
+            self.handle_data(' ')
+        elif tag == 'li':
+            self._li_depth += 1
+        elif tag == 'h2':
+            self._in_h2 = True
+        elif tag == 'a' and self._in_h2 and self._result['link'] is None:
+            self._result['link'] = attributes.get('href') or ''
+            self._in_title_link = True
+        
+        if self._caption_tag is None:
+            if 'b_caption' in classes:
+                self._caption_tag = tag
+                self._caption_depth = 1
+        elif tag == self._caption_tag:
+            self._caption_depth += 1
+        
+        if tag == 'p' and self._caption_tag and not self._result['has_description']:
+            self._in_caption_p = True
+    
+    def handle_endtag(self, tag):
+        if self._result is None:
+            return
+        
+        if tag == 'a' and self._in_title_link:
+            self._in_title_link = False
+        elif tag == 'h2':
+            self._in_h2 = False
+        elif tag == 'p' and self._in_caption_p:
+            self._in_caption_p = False
+            self._result['has_description'] = True
+        
+        if self._caption_tag and tag == self._caption_tag:
+            self._caption_depth -= 1
+            if self._caption_depth == 0:
+                self._caption_tag = None
+        
+        if tag == 'li':
+            self._li_depth -= 1
+            if self._li_depth == 0:
+                self._finish_result()
+    
+    def handle_data(self, data):
+        if self._result is None:
+            return
+        if self._in_title_link:
+            self._result['title'].append(data)
+        elif self._in_caption_p:
+            self._result['description'].append(data)
+    
+    def close(self):
+        super().close()
+        if self._result is not None:
+            self._finish_result()
+    
+    def _finish_result(self):
+        result = self._result
+        self._result = None
+        self._in_h2 = self._in_title_link = self._in_caption_p = False
+        self._caption_tag = None
+        if result['link'] is None:
+            return
+        title = ' '.join(''.join(result['title']).split())
+        description = ' '.join(''.join(result['description']).split())
+        self.results.append((title, result['link'], description))
+
+def parse_bing_results(html: str) -> List[Tuple[str, str, str]]:
+    """Parse a Bing results page into (title, link, description) tuples."""
+    parser = BingResultsParser()
+    parser.feed(html)
+    parser.close()
+    return parser.results
+
+@dataclass(slots=True)
 class Employee:
     """Employee data structure for website search results."""
     first_name: str
@@ -80,10 +293,13 @@ class WebsiteEmployeeScraper:
         self.script_dir = Path(__file__).parent.absolute()
         self.driver = None
         self.max_retries = 3
-        self.processed_names: Set[str] = set()
+        self.max_concurrency = self.config.get('max_concurrency', 5)
+        self.processed_names: Set[Tuple[str, str]] = set()
+        self.processed_pages: Set[bytes] = set()
         
         # Job titles to search for
         self.job_titles = self._get_job_titles_to_search()
+        self._compile_patterns()
         
         # User agents for rotation
         self.user_agents = [
@@ -143,6 +359,67 @@ class WebsiteEmployeeScraper:
         
         return default_titles
     
+    def _compile_patterns(self):
+        """Compile the employee patterns once, including the job title specific ones."""
+        self._job_titles_lower: List[str] = [job_title.lower() for job_title in self.job_titles]
+        
+        # Either direction of the title/search list containment check in one
+        # call each: a regex for "contains a job title", and a search in the
+        # NUL-joined titles for "is contained in a job title"
+        self._job_title_rx = re.compile('|'.join(map(re.escape, self._job_titles_lower))) if self.job_titles else None
+        self._job_titles_blob = '\0'.join(self._job_titles_lower)
+        
+        patterns = list(EMPLOYEE_PATTERNS)
+        # Lowercased job titles a pattern needs at least one of in the text, if any
+        required_titles: List[Optional[Tuple[str, ...]]] = [None] * len(patterns)
+        
+        # Add patterns for the job titles we're searching for, one alternation
+        # covering all of them per word order
+        search_titles = self.job_titles[:10]  # Use first 10 to avoid too many patterns
+        if search_titles:
+            title_union = '|'.join(map(re.escape, search_titles))
+            
+            # Pattern: "John Smith, Property Manager"
+            patterns.append(rf'([A-Z][a-z]+)\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?),?\s+(?:{title_union})')
+            
+            # Pattern: "Property Manager John Smith"
+            patterns.append(rf'(?:{title_union})\s+([A-Z][a-z]+)\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?)')
+            
+            required_titles.extend([tuple(job_title.lower() for job_title in search_titles)] * 2)
+        
+        self._compiled_patterns: List[Tuple[re.Pattern, Optional[Tuple[str, ...]]]] = [
+            (re.compile(pattern, re.IGNORECASE), required)
+            for pattern, required in zip(patterns, required_titles)
+        ]
+        
+        # All patterns fused into one alternation. One scan tells whether any
+        # pattern can match at all, so texts without a hit skip the
+        # per-pattern passes entirely.
+        fused_pattern = '|'.join(f'(?:{pattern})' for pattern in patterns)
+        self._employee_screen_rx = None
+        if re2 is not None:
+            try:
+                self._employee_screen_rx = re2.compile(f'(?i){fused_pattern}')
+            except Exception as e:
+                logger.debug(f"re2 could not compile employee screen, using re: {e}")
+        if self._employee_screen_rx is None:
+            self._employee_screen_rx = re.compile(fused_pattern, re.IGNORECASE)
+        
+        # Title keywords followed by the configured job titles, each tagged
+        # with its priority so a single scan can still honour the lookup order.
+        # Longer job titles come first so the longest contained title wins.
+        self._title_lookup: List[Tuple[str, str]] = list(TITLE_KEYWORDS.items())
+        self._title_lookup.extend(sorted(zip(self._job_titles_lower, self.job_titles),
+                                         key=lambda pair: len(pair[0]), reverse=True))
+        self._title_automaton = None
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for rank, (needle, title) in enumerate(self._title_lookup):
+                if needle and not automaton.exists(needle):
+                    automaton.add_word(needle, (rank, title))
+            automaton.make_automaton()
+            self._title_automaton = automaton
+    
     def _setup_browser(self) -> webdriver.Chrome:
         """Configure and return a Chrome WebDriver."""
         logger.info("Setting up browser...")
@@ -157,102 +434,102 @@ class WebsiteEmployeeScraper:
         chrome_options.add_experimental_option('useAutomationExtension', False)
         chrome_options.add_argument(f'user-agent={random.choice(self.user_agents)}')
         
+        # Only the result markup is read, so skip images
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+        })
+        # Return from driver.get() once the DOM is ready rather than after every subresource
+        chrome_options.page_load_strategy = 'eager'
+        
         try:
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
+            try:
+                service = Service(self._chromedriver_path())
+                driver = webdriver.Chrome(service=service, options=chrome_options)
+            except SessionNotCreatedException:
+                # The cached driver may predate a Chrome update; fetch a matching one once
+                logger.info("Cached ChromeDriver does not match Chrome, reinstalling")
+                try:
+                    CHROMEDRIVER_CACHE_FILE.unlink()
+                except OSError:
+                    pass
+                service = Service(self._chromedriver_path())
+                driver = webdriver.Chrome(service=service, options=chrome_options)
             driver.set_page_load_timeout(30)
-            driver.implicitly_wait(10)
             driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             return driver
         except Exception as e:
             logger.error(f"Browser setup error: {e}")
             raise
     
-    def _is_valid_employee_name(self, first_name: str, last_name: str) -> bool:
-        """Check if extracted name parts are likely to be valid employee names."""
-        # Basic validation
-        if not first_name or not last_name or len(first_name) < 2 or len(last_name) < 2:
-            return False
+    def _chromedriver_path(self) -> str:
+        """Return the ChromeDriver path, only asking ChromeDriverManager when the cached one is stale."""
+        try:
+            if time.time() - CHROMEDRIVER_CACHE_FILE.stat().st_mtime < CHROMEDRIVER_CACHE_TTL:
+                driver_path = CHROMEDRIVER_CACHE_FILE.read_text(encoding='utf-8').strip()
+                if driver_path and os.path.exists(driver_path):
+                    return driver_path
+        except OSError:
+            pass
         
-        if len(first_name) > 25 or len(last_name) > 30:
+        driver_path = ChromeDriverManager().install()
+        try:
+            CHROMEDRIVER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            CHROMEDRIVER_CACHE_FILE.write_text(driver_path, encoding='utf-8')
+        except OSError as e:
+            logger.debug(f"Could not cache ChromeDriver path: {e}")
+        return driver_path
+    
+    def _is_valid_employee_name(self, first_name: str, last_name: str,
+                                first_folded: Optional[str] = None, last_folded: Optional[str] = None) -> bool:
+        """Check if extracted name parts are likely to be valid employee names.
+        
+        Callers that already hold the casefolded name parts can pass them in.
+        """
+        # Basic validation
+        if not (2 <= len(first_name) <= 25 and 2 <= len(last_name) <= 30):
             return False
         
-        if not re.match(r"^[a-zA-Z\-']+$", first_name) or not re.match(r"^[a-zA-Z\-']+$", last_name):
+        if not (NAME_PART_RE.fullmatch(first_name) and NAME_PART_RE.fullmatch(last_name)):
             return False
         
         # Enhanced business term detection
-        business_terms = {
-            'appoints', 'announces', 'welcomes', 'promotes', 'elevates', 'names',
-            'chief', 'officer', 'executive', 'financial', 'revenue', 'operating',
-            'strategy', 'technology', 'interim', 'board', 'chair', 'director',
-            'positions', 'hedge', 'fund', 'managers', 'portfolio', 'operations',
-            'leadership', 'general', 'terms', 'acquisition', 'clearwater', 
-            'analytics', 'finalizes', 'investor', 'quarter', 'press', 'release',
-            'client', 'success', 'traders', 'demo', 'back', 'build', 'nothing',
-            'move', 'learning', 'read', 'more', 'open', 'second', 'first',
-            'company', 'corporation', 'enterprise', 'group', 'holdings',
-            'management', 'development', 'consulting', 'services', 'solutions',
-            'keeps', 'your', 'office', 'enfusion', 'sustains', 'global'
-        }
-        
-        if (first_name.lower() in business_terms or 
-            last_name.lower() in business_terms):
+        if first_folded is None:
+            first_folded = first_name.casefold()
+        if last_folded is None:
+            last_folded = last_name.casefold()
+        if first_folded in BUSINESS_TERMS or last_folded in BUSINESS_TERMS:
             return False
         
         # Check for title combinations
-        full_name_lower = f"{first_name.lower()} {last_name.lower()}"
-        title_combinations = [
-            'chief executive', 'chief financial', 'chief technology', 'chief operating',
-            'executive officer', 'financial officer', 'technology officer', 'operating officer',
-            'vice president', 'board chair', 'board member', 'managing director',
-            'keeps your', 'back office', 'enfusion names', 'enfusion announces',
-            'enfusion sustains', 'global growth'
-        ]
-        
-        for combo in title_combinations:
-            if combo in full_name_lower:
-                return False
-        
-        return True
+        return not TITLE_COMBINATION_RE.search(f"{first_folded} {last_folded}")
     
     def _extract_employees_from_text(self, text: str, company_name: str, source_link: str) -> List[Employee]:
         """Extract employee information from text content with improved accuracy and job title matching."""
         employees = []
         
         try:
-            # Enhanced employee patterns including job title-specific searches
-            employee_patterns = [
-                # "appoints/names/promotes FirstName LastName as/to Title"
-                r'(?:appoints?|names?|promotes?|welcomes?|announces?)\s+([A-Z][a-z]+)\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?)\s+(?:as|to|as\s+the|to\s+the\s+position\s+of)\s+([^.]{5,50})',
-                
-                # "FirstName LastName, Title" or "FirstName LastName as Title"
-                r'([A-Z][a-z]+)\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?),?\s+(?:as\s+)?([^.,]{10,60}(?:Chief|Director|Manager|Officer|President|VP|Vice\s+President)[^.,]{0,20})',
-                
-                # "Title FirstName LastName" (when title comes first)
-                r'(?:Chief|Director|Manager|Officer|President|VP|Vice\s+President)\s+([A-Z][a-z]+)\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?)',
-                
-                # Look for patterns like "Brad Herring has been appointed"
-                r'([A-Z][a-z]+)\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?)\s+(?:has\s+been|was|is)\s+(?:appointed|named|promoted|hired)',
-                
-                # Job title specific patterns
-                r'([A-Z][a-z]+)\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?)\s+(?:joins|joined)\s+.*?(?:as|as\s+a|as\s+the)\s+([^.,]{5,50})',
-                
-                # Pattern for "John Smith is our new Property Manager"
-                r'([A-Z][a-z]+)\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?)\s+is\s+(?:our\s+)?(?:new\s+)?([^.,]{5,50}(?:Manager|Director|Officer|Executive|Analyst|Specialist)[^.,]{0,20})'
-            ]
+            # Cheap necessary condition first: every pattern needs two words in a row
+            if not NAME_BIGRAM_RE.search(text) or not self._employee_screen_rx.search(text):
+                return employees
+            text_lower = text.lower()
             
-            # Add patterns for specific job titles we're searching for
-            for job_title in self.job_titles[:10]:  # Use first 10 to avoid too many patterns
-                # Pattern: "John Smith, Property Manager"
-                title_pattern = rf'([A-Z][a-z]+)\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?),?\s+{re.escape(job_title)}'
-                employee_patterns.append(title_pattern)
-                
-                # Pattern: "Property Manager John Smith"
-                reverse_pattern = rf'{re.escape(job_title)}\s+([A-Z][a-z]+)\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?)'
-                employee_patterns.append(reverse_pattern)
+            # Loop invariants, looked up once per text rather than per match
+            processed_names = self.processed_names
+            is_valid_name = self._is_valid_employee_name
+            infer_title = self._infer_title_from_context
+            determine_confidence = self._determine_confidence_level
+            location = self.config.get('location', '')
+            intern = sys.intern
             
-            for pattern in employee_patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
+            # Each pattern is still scanned separately so overlapping matches
+            # from different patterns are all considered
+            for pattern, required in self._compiled_patterns:
+                # Job title patterns cannot match without one of their titles in the text
+                if required and not any(job_title in text_lower for job_title in required):
+                    continue
+                
+                matches = pattern.finditer(text)
                 
                 for match in matches:
                     try:
@@ -267,23 +544,27 @@ class WebsiteEmployeeScraper:
                             if len(groups) >= 3 and groups[2]:
                                 title = groups[2].strip()
                                 # Clean up title
-                                title = re.sub(r'^(as\s+|to\s+|the\s+)', '', title, flags=re.IGNORECASE)
+                                title = TITLE_PREFIX_RE.sub('', title)
                                 title = title.strip('.,')
                             else:
                                 # Try to infer title from the pattern match
-                                title = self._infer_title_from_context(match.group(0), first_name, last_name)
+                                title = infer_title(match.group(0), first_name, last_name)
+                            
+                            # Casefold once; interned so repeat names share one string
+                            first_folded = intern(first_name.casefold())
+                            last_folded = intern(last_name.casefold())
                             
                             # Validate this is a real person name
-                            if not self._is_valid_employee_name(first_name, last_name):
+                            if not is_valid_name(first_name, last_name, first_folded, last_folded):
                                 continue
                             
                             # Check if already processed
-                            name_key = f"{first_name.lower()}_{last_name.lower()}"
-                            if name_key in self.processed_names:
+                            name_key = (first_folded, last_folded)
+                            if name_key in processed_names:
                                 continue
                             
                             # Determine confidence based on job title match and context
-                            confidence = self._determine_confidence_level(title, match.group(0))
+                            confidence = determine_confidence(title, match.group(0))
                             
                             # Create employee record
                             employee = Employee(
@@ -292,13 +573,13 @@ class WebsiteEmployeeScraper:
                                 title=title,
                                 source_link=source_link,
                                 company_name=company_name,
-                                location=self.config.get('location', ''),
+                                location=location,
                                 confidence=confidence,
                                 source='Website Search Results'
                             )
                             
                             employees.append(employee)
-                            self.processed_names.add(name_key)
+                            processed_names.add(name_key)
                             logger.info(f"Found: {first_name} {last_name} - {title} (confidence: {confidence})")
                             
                     except Exception as e:
@@ -312,29 +593,21 @@ class WebsiteEmployeeScraper:
     
     def _infer_title_from_context(self, match_text: str, first_name: str, last_name: str) -> str:
         """Infer job title from the context of the match."""
-        # Look for title keywords in the surrounding text
-        title_keywords = {
-            'manager': 'Manager',
-            'director': 'Director', 
-            'executive': 'Executive',
-            'officer': 'Officer',
-            'president': 'President',
-            'head': 'Head',
-            'lead': 'Lead',
-            'chief': 'Chief',
-            'senior': 'Senior',
-            'principal': 'Principal'
-        }
-        
         match_lower = match_text.lower()
-        for keyword, title in title_keywords.items():
-            if keyword in match_lower:
-                return title
         
-        # Check against our job title list
-        for job_title in self.job_titles:
-            if job_title.lower() in match_lower:
-                return job_title
+        if self._title_automaton is not None:
+            best = None
+            for _, (rank, title) in self._title_automaton.iter(match_lower):
+                if best is None or rank < best[0]:
+                    best = (rank, title)
+                    if rank == 0:
+                        break
+            return best[1] if best else "Unknown"
+        
+        # Look for title keywords, then our job title list, in the surrounding text
+        for needle, title in self._title_lookup:
+            if needle in match_lower:
+                return title
         
         return "Unknown"
     
@@ -346,22 +619,19 @@ class WebsiteEmployeeScraper:
         if title and title != "Unknown":
             score += 2
         
+        title_lower = title.lower()
+        
         # Boost score if title matches our search list
-        if title != "Unknown":
-            for search_title in self.job_titles:
-                if search_title.lower() in title.lower() or title.lower() in search_title.lower():
-                    score += 3
-                    break
+        if title != "Unknown" and self._job_title_rx is not None:
+            if self._job_title_rx.search(title_lower) or ('\0' not in title_lower and title_lower in self._job_titles_blob):
+                score += 3
         
         # Context indicators
-        context_lower = context.lower()
-        positive_indicators = ['appointed', 'promoted', 'joins', 'joined', 'announces', 'welcomes']
-        if any(indicator in context_lower for indicator in positive_indicators):
+        if _POSITIVE_INDICATORS.intersection(_WORD_RE.findall(context.lower())):
             score += 2
         
         # Job title quality indicators
-        quality_titles = ['director', 'manager', 'executive', 'officer', 'president', 'chief', 'head']
-        if any(quality in title.lower() for quality in quality_titles):
+        if any(quality in title_lower for quality in _QUALITY_TITLES):
             score += 1
         
         # Determine confidence level
@@ -372,54 +642,129 @@ class WebsiteEmployeeScraper:
         else:
             return 'low'
     
-    def _process_search_results_page(self, company_name: str) -> List[Employee]:
-        """Process a page of search results for employee information."""
+    def _process_search_results(self, results: List[Tuple[str, str, str]], company_name: str) -> List[Employee]:
+        """Extract employees from (title, link, description) search results."""
         employees = []
+        extract = self._extract_employees_from_text
         
+        for title, link, description in results:
+            try:
+                if not link:
+                    continue
+                
+                # Combine title and description for analysis
+                content = f"{title}\n{description}"
+                
+                # Extract employees from the content
+                page_employees = extract(content, company_name, link)
+                
+                if page_employees:
+                    employees.extend(page_employees)
+                    logger.info(f"Found {len(page_employees)} employees in {link}")
+                
+            except Exception as e:
+                logger.debug(f"Error processing search result: {e}")
+                continue
+        
+        return employees
+    
+    def _process_search_results_page(self, html: str, company_name: str) -> List[Employee]:
+        """Process a results page the browser has loaded, parsed from its HTML in-process."""
+        results = []
+        
+        try:
+            results = parse_bing_results(html)
+            logger.info(f"Found {len(results)} search results")
+        except Exception as e:
+            logger.error(f"Error processing search results page: {e}")
+        
+        return self._process_search_results(results, company_name)
+    
+    def _is_new_page(self, html: str) -> bool:
+        """Record a results page by digest; False if an identical page was already processed."""
+        digest = hashlib.blake2b(html.encode('utf-8'), digest_size=16).digest()
+        if digest in self.processed_pages:
+            return False
+        self.processed_pages.add(digest)
+        return True
+    
+    def _fetch_search_page(self, query: str) -> str:
+        """Fetch the Bing results page for a query over plain HTTP."""
         try:
-            WebDriverWait(self.driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'li.b_algo'))
+            response = requests.get(
+                "https://www.bing.com/search",
+                params={'q': query},
+                headers={'User-Agent': random.choice(self.user_agents)},
+                timeout=30
             )
+            if response.status_code == 200:
+                return response.text
+            logger.warning(f"Search request returned {response.status_code} for: {query}")
+        except Exception as e:
+            logger.warning(f"Search request failed for {query}: {e}")
+        return ""
+    
+    def _fetch_search_pages(self, queries: List[str]) -> Iterator[Tuple[str, str]]:
+        """Yield (query, html) in query order, fetching up to max_concurrency pages at once.
+        
+        The next batch is requested before the current one is handed back,
+        so parsing and extraction overlap with the network wait. A caller
+        that stops early leaves at most two batches of requests unused.
+        """
+        batch_size = max(1, self.max_concurrency)
+        with ThreadPoolExecutor(max_workers=batch_size) as pool:
+            def submit(start: int):
+                batch = queries[start:start + batch_size]
+                return batch, [pool.submit(self._fetch_search_page, query) for query in batch]
             
-            result_elements = self.driver.find_elements(By.CSS_SELECTOR, 'li.b_algo')
-            logger.info(f"Found {len(result_elements)} search results")
+            pending = submit(0)
+            for start in range(batch_size, len(queries) + batch_size, batch_size):
+                batch, futures = pending
+                pending = submit(start)
+                for query, future in zip(batch, futures):
+                    yield query, future.result()
+    
+    def _search_query_in_browser(self, query: str, company_name: str, max_pages: int) -> List[Employee]:
+        """Run one query through Selenium, for pages the HTTP fetch could not parse."""
+        employees = []
+        
+        if not self.driver:
+            self.driver = self._setup_browser()
+        
+        search_url = f"https://www.bing.com/search?q={quote_plus(query)}"
+        self.driver.get(search_url)
+        blocked = False
+        
+        # Process pages
+        for page_num in range(min(max_pages, 3)):  # Limit to 3 pages for website search
+            try:
+                WebDriverWait(self.driver, 15).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, 'li.b_algo'))
+                )
+            except TimeoutException:
+                logger.warning("Timeout waiting for search results")
             
-            for result in result_elements:
-                try:
-                    title_element = result.find_element(By.CSS_SELECTOR, 'h2 a')
-                    title = title_element.text
-                    link = title_element.get_attribute('href')
-                    
-                    if not link:
-                        continue
-                    
-                    # Extract description
-                    description = ""
-                    try:
-                        desc_element = result.find_element(By.CSS_SELECTOR, '.b_caption p')
-                        description = desc_element.text
-                    except NoSuchElementException:
-                        pass
-                    
-                    # Combine title and description for analysis
-                    content = f"{title}\n{description}"
-                    
-                    # Extract employees from the content
-                    page_employees = self._extract_employees_from_text(content, company_name, link)
-                    
-                    for emp in page_employees:
-                        employees.append(emp)
-                        logger.info(f"Found employee: {emp.first_name} {emp.last_name}")
-                    
-                except Exception as e:
-                    logger.debug(f"Error processing search result: {e}")
-                    continue
+            # One page_source transfer instead of a round-trip per result element
+            html = self.driver.page_source
+            if is_blocked_page(html):
+                logger.warning("Search engine is challenging automated queries")
+                blocked = True
+                break
             
-        except TimeoutException:
-            logger.warning("Timeout waiting for search results")
-        except Exception as e:
-            logger.error(f"Error processing search results page: {e}")
+            if not self._is_new_page(html):
+                logger.info("Page already processed, skipping")
+                break
+            
+            logger.info(f"Processing page {page_num + 1}")
+            
+            employees.extend(self._process_search_results_page(html, company_name))
+            
+            if len(employees) >= 30:
+                break
         
+        # Only back off when the search engine pushed back
+        if blocked:
+            time.sleep(random.uniform(3, 6))
         return employees
     
     def search_employees(self) -> List[Dict]:
@@ -435,8 +780,6 @@ class WebsiteEmployeeScraper:
         logger.info(f"Will search for {len(self.job_titles)} different job titles")
         
         try:
-            self.driver = self._setup_browser()
-            
             # Create search queries with job title integration
             parsed_url = urlparse(website if website.startswith('http') else f'https://{website}')
             domain = parsed_url.netloc or parsed_url.path
@@ -472,30 +815,31 @@ class WebsiteEmployeeScraper:
             ]
             queries.extend(alt_queries)
             
+            # Drop repeated queries, keeping the original order
+            queries = list(dict.fromkeys(queries))
+            
             logger.info(f"Created {len(queries)} search queries including job title searches")
             
-            for query_idx, query in enumerate(queries, 1):
+            # Result pages are fetched concurrently over HTTP; the browser is
+            # only started for pages that come back without parseable results
+            for query_idx, (query, html) in enumerate(self._fetch_search_pages(queries), 1):
                 if len(all_employees) >= 30:  # Reasonable limit for website search
                     break
                 
                 logger.info(f"Processing query {query_idx}/{len(queries)}: {query}")
                 
                 try:
-                    search_url = f"https://www.bing.com/search?q={quote_plus(query)}"
-                    self.driver.get(search_url)
-                    time.sleep(random.uniform(2, 4))
-                    
-                    # Process pages
-                    for page_num in range(min(max_pages, 3)):  # Limit to 3 pages for website search
-                        logger.info(f"Processing page {page_num + 1}")
-                        
-                        page_employees = self._process_search_results_page(company_name)
-                        all_employees.extend(page_employees)
-                        
-                        if len(all_employees) >= 30:
-                            break
+                    if html and not self._is_new_page(html):
+                        logger.info("Identical results page already processed, skipping")
+                        continue
                     
-                    time.sleep(random.uniform(3, 6))
+                    results = parse_bing_results(html) if html else []
+                    if results:
+                        logger.info(f"Found {len(results)} search results")
+                        all_employees.extend(self._process_search_results(results, company_name))
+                    else:
+                        logger.info("No parseable results over HTTP, using browser")
+                        all_employees.extend(self._search_query_in_browser(query, company_name, max_pages))
                     
                 except Exception as e:
                     logger.error(f"Error processing query: {e}")
@@ -512,7 +856,7 @@ class WebsiteEmployeeScraper:
                     logger.warning(f"Error closing browser: {e}")
         
         logger.info(f"Website search completed. Found {len(all_employees)} employees")
-        return [emp.__dict__ for emp in all_employees]
+        return [asdict(emp) for emp in all_employees]
     
     def create_excel_report(self, employees: List[Dict]) -> bool:
         """Create Excel report from website search results."""
@@ -524,61 +868,69 @@ class WebsiteEmployeeScraper:
         try:
             try:
                 import openpyxl
-                from openpyxl.styles import Font, PatternFill, Alignment
             except ImportError:
                 logger.info("Installing openpyxl...")
                 subprocess.call([sys.executable, "-m", "pip", "install", "openpyxl"])
                 import openpyxl
-                from openpyxl.styles import Font, PatternFill, Alignment
+            from openpyxl.cell import WriteOnlyCell
+            from openpyxl.styles import Font, PatternFill, Alignment
+            from openpyxl.utils import get_column_letter
             
             logger.info("Creating Excel report...")
             print(f"Creating Excel report with {len(employees)} employees...")
             
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "Website Search Results"
-            
             headers = ["First Name", "Last Name", "Job Title", "Source", "Confidence", "Source Link", "Location"]
             
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col, value=header)
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
-                cell.alignment = Alignment(horizontal="center")
-            
-            for row, emp in enumerate(employees, 2):
-                ws.cell(row=row, column=1, value=emp.get('first_name', ''))
-                ws.cell(row=row, column=2, value=emp.get('last_name', ''))
-                ws.cell(row=row, column=3, value=emp.get('title', ''))
-                ws.cell(row=row, column=4, value=emp.get('source', ''))
-                
-                conf_cell = ws.cell(row=row, column=5, value=emp.get('confidence', '').upper())
-                if conf_cell.value == 'HIGH':
-                    conf_cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-                elif conf_cell.value == 'MEDIUM':
-                    conf_cell.fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-                else:
-                    conf_cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+            # Flatten employees into rows, tallying column widths on the way
+            max_lengths = [len(header) for header in headers]
+            rows = []
+            for emp in employees:
+                row = (emp.get('first_name', ''), emp.get('last_name', ''), emp.get('title', ''),
+                       emp.get('source', ''), emp.get('confidence', '').upper(),
+                       emp.get('source_link', '') or emp.get('link', ''), emp.get('location', ''))
+                for col, value in enumerate(row):
+                    length = len(str(value))
+                    if length > max_lengths[col]:
+                        max_lengths[col] = length
+                rows.append(row)
+            
+            # Styles are created once and shared by every cell that uses them
+            header_font = Font(bold=True)
+            header_fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
+            header_alignment = Alignment(horizontal="center")
+            link_font = Font(color="0000FF", underline="single")
+            confidence_fills = {
+                'HIGH': PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid"),
+                'MEDIUM': PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid"),
+            }
+            low_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+            
+            # Write-only mode streams rows out instead of keeping every cell in memory
+            wb = openpyxl.Workbook(write_only=True)
+            ws = wb.create_sheet("Website Search Results")
+            
+            for col, max_length in enumerate(max_lengths, 1):
+                ws.column_dimensions[get_column_letter(col)].width = min(max_length + 2, 50)
+            
+            header_row = []
+            for header in headers:
+                cell = WriteOnlyCell(ws, value=header)
+                cell.font = header_font
+                cell.fill = header_fill
+                cell.alignment = header_alignment
+                header_row.append(cell)
+            ws.append(header_row)
+            
+            for first_name, last_name, title, source, confidence, link, location in rows:
+                conf_cell = WriteOnlyCell(ws, value=confidence)
+                conf_cell.fill = confidence_fills.get(confidence, low_fill)
                 
-                link = emp.get('source_link', '') or emp.get('link', '')
-                link_cell = ws.cell(row=row, column=6, value=link)
+                link_cell = WriteOnlyCell(ws, value=link)
                 if link:
                     link_cell.hyperlink = link
-                    link_cell.font = Font(color="0000FF", underline="single")
+                    link_cell.font = link_font
                 
-                ws.cell(row=row, column=7, value=emp.get('location', ''))
-            
-            for col in ws.columns:
-                max_length = 0
-                column = col[0].column_letter
-                for cell in col:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column].width = adjusted_width
+                ws.append([first_name, last_name, title, source, conf_cell, link_cell, location])
             
             company_name = self.config.get('company_name', 'Company').replace(' ', '_')
             location = self.config.get('location', 'Location').replace(' ', '_')
@@ -621,8 +973,7 @@ class WebsiteEmployeeScraper:
         """Save search results to files."""
         try:
             website_file = self.script_dir / "website_employees.json"
-            with open(website_file, 'w', encoding='utf-8') as f:
-                json.dump(employees, f, indent=4, ensure_ascii=False)
+            website_file.write_bytes(_json_dumps(employees))
             
             logger.info(f"Results saved: {len(employees)} employees")
             return True
@@ -667,15 +1018,11 @@ def main():
             
             if scraper.save_results(employees):
                 # Show summary by confidence and job titles
-                confidence_counts = {}
-                job_title_counts = {}
-                for emp in employees:
-                    conf = emp.get('confidence', 'unknown')
-                    confidence_counts[conf] = confidence_counts.get(conf, 0) + 1
-                    
-                    title = emp.get('title', 'Unknown')
-                    if title != 'Unknown':
-                        job_title_counts[title] = job_title_counts.get(title, 0) + 1
+                confidence_counts = Counter(emp.get('confidence', 'unknown') for emp in employees)
+                job_title_counts = Counter(
+                    title for title in (emp.get('title', 'Unknown') for emp in employees)
+                    if title != 'Unknown'
+                )
                 
                 print("\nConfidence breakdown:")
                 for conf, count in sorted(confidence_counts.items()):
@@ -684,7 +1031,7 @@ def main():
                 print(f"\nFound {len(job_title_counts)} unique job titles")
                 if job_title_counts:
                     print("Top job titles found:")
-                    for title, count in sorted(job_title_counts.items(), key=lambda x: x[1], reverse=True)[:5]:
+                    for title, count in job_title_counts.most_common(5):
                         print(f"  - {title}: {count}")
                 
                 print("\nGenerating Excel report...")
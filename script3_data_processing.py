@@ -6,15 +6,18 @@ This script provides an interactive review process for employee data
 with improved filtering, validation, and Excel generation capabilities.
 """
 
+import importlib
 import json
 import logging
+import mmap
 import os
 import subprocess
 import sys
 import time
+from collections import Counter, defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Set, Tuple
+from typing import Iterator, List, Dict, Optional, Set, Tuple
 from dataclasses import dataclass
 
 # Configure logging
@@ -24,6 +27,95 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# ijson is optional; it streams records out of the input files one at a time
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# orjson is optional; it parses and serialises employee lists much faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Sort rank of each confidence level; anything else sorts with 'low'
+CONFIDENCE_RANK = {'high': 0, 'medium': 1, 'low': 2}
+VALID_CONFIDENCE = frozenset(CONFIDENCE_RANK)
+
+# Low confidence records shown per screen during interactive review
+REVIEW_BULK_SIZE = 10
+
+# ANSI sequence that clears the terminal and homes the cursor
+CLEAR_SCREEN = '\x1b[2J\x1b[H'
+
+# Files from this size up are memory-mapped (or streamed) rather than read whole
+LARGE_JSON_FILE = 64 * 1024 * 1024
+
+def load_json_file(file_path: Path, size: Optional[int] = None):
+    """Parse a JSON file, with orjson when it is installed.
+    
+    size is the file size in bytes when the caller already knows it.
+    """
+    if orjson is None:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    if size is None:
+        size = file_path.stat().st_size
+    if size < LARGE_JSON_FILE:
+        return orjson.loads(file_path.read_bytes())
+    
+    # Hand the mapped pages straight to the parser instead of copying them first
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+def dump_json_file(file_path: Path, data, pretty: bool = False) -> None:
+    """Write data as compact JSON, or indented when pretty, with orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        file_path.write_bytes(orjson.dumps(data, option=option))
+    else:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            if pretty:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            else:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+
+# Set once a pip install of openpyxl has been tried, so it is not retried
+_openpyxl_install_attempted = False
+
+def load_openpyxl():
+    """Import openpyxl on first use, trying to pip install it at most once per run."""
+    global _openpyxl_install_attempted
+    try:
+        import openpyxl
+    except ImportError:
+        if _openpyxl_install_attempted:
+            raise
+        _openpyxl_install_attempted = True
+        logger.info("Installing openpyxl...")
+        subprocess.call([sys.executable, "-m", "pip", "install", "openpyxl"])
+        importlib.invalidate_caches()
+        import openpyxl
+    return openpyxl
+
+def iter_employee_records(file_path: Path, size: Optional[int] = None) -> Iterator[Dict]:
+    """Yield the records of a JSON array file; other JSON roots yield nothing."""
+    if size is None:
+        size = file_path.stat().st_size
+    
+    # Large files are streamed when possible; smaller ones parse fastest in one go
+    if ijson is not None and size >= LARGE_JSON_FILE:
+        with open(file_path, 'rb') as f:
+            yield from ijson.items(f, 'item', use_float=True)
+        return
+    
+    data = load_json_file(file_path, size)
+    if isinstance(data, list):
+        yield from data
+
 @dataclass
 class EmployeeStats:
     """Statistics about employee data."""
@@ -36,15 +128,28 @@ class EmployeeStats:
 class EmployeeDataProcessor:
     """Enhanced employee data processor with validation and review capabilities."""
     
-    def __init__(self, config_path: str):
-        """Initialize the data processor."""
+    def __init__(self, config_path: str, pretty_json: bool = False):
+        """Initialize the data processor.
+        
+        The JSON files written are compact unless pretty_json is set.
+        """
         self.config = self._load_config(config_path)
+        self.pretty_json = pretty_json
+        
+        # An empty shell command switches the Windows console to processing
+        # ANSI escapes, which _clear_screen relies on
+        if os.name == 'nt':
+            os.system('')
         self.script_dir = Path(__file__).parent.absolute()
         
         # File paths
         self.verified_data_file = "verified_employee_data.json"
         self.processed_data_file = self.config.get('processed_data_file', 'processed_employee_data.json')
         
+        # Defaults for records that do not carry their own location or company
+        self.default_location = self.config.get('location', '')
+        self.default_company_name = self.config.get('company_name', '')
+        
         # Load employee data
         self.employees = self._load_all_employee_data()
         
@@ -57,18 +162,17 @@ class EmployeeDataProcessor:
             logger.error(f"Configuration error: {e}")
             sys.exit(1)
     
-    def _get_employee_id(self, employee: Dict) -> str:
+    def _get_employee_id(self, employee: Dict) -> Tuple[str, str]:
         """Generate a unique ID for an employee to detect duplicates."""
-        first_name = employee.get('first_name', '').lower().strip()
-        last_name = employee.get('last_name', '').lower().strip()
-        return f"{first_name}_{last_name}"
+        return (employee.get('first_name', '').lower().strip(),
+                employee.get('last_name', '').lower().strip())
     
     def _load_all_employee_data(self) -> List[Dict]:
         """Load employee data from all available sources with deduplication."""
         logger.info("Loading employee data from all sources...")
         
         all_employees = []
-        existing_ids = set()
+        existing_ids: Set[Tuple[str, str]] = set()
         
         # Check all potential data files in priority order
         potential_files = [
@@ -81,34 +185,40 @@ class EmployeeDataProcessor:
             "url_processed_employees.json"
         ]
         
+        # One directory listing instead of a stat per candidate file; the
+        # entries also carry the sizes the JSON reader needs
+        with os.scandir(self.script_dir) as entries:
+            data_files = {entry.name: entry for entry in entries if entry.is_file()}
+        
         for filename in potential_files:
-            file_path = self.script_dir / filename
-            if file_path.exists():
+            entry = data_files.get(filename)
+            if entry is not None:
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    if isinstance(data, list) and data:
-                        logger.info(f"Loaded {len(data)} employees from {filename}")
-                        
-                        # Add unique employees
-                        added_count = 0
-                        for emp in data:
-                            # Validate basic structure
-                            if not self._is_valid_employee_record(emp):
-                                continue
-                                
-                            emp_id = self._get_employee_id(emp)
-                            if emp_id and emp_id not in existing_ids:
-                                # Standardize and clean the record
-                                cleaned_emp = self._clean_employee_record(emp)
-                                all_employees.append(cleaned_emp)
-                                existing_ids.add(emp_id)
-                                added_count += 1
+                    # Records are validated and deduplicated as they are read,
+                    # so only accepted ones are kept in memory
+                    loaded_count = 0
+                    added_count = 0
+                    for emp in iter_employee_records(Path(entry.path), entry.stat().st_size):
+                        loaded_count += 1
                         
-                        if added_count > 0:
-                            logger.info(f"  - Added {added_count} unique employees from {filename}")
+                        # Validate basic structure
+                        if not self._is_valid_employee_record(emp):
+                            continue
                             
+                        emp_id = self._get_employee_id(emp)
+                        if emp_id and emp_id not in existing_ids:
+                            # Standardize and clean the record
+                            cleaned_emp = self._clean_employee_record(emp)
+                            all_employees.append(cleaned_emp)
+                            existing_ids.add(emp_id)
+                            added_count += 1
+                    
+                    if loaded_count:
+                        logger.info(f"Loaded {loaded_count} employees from {filename}")
+                    
+                    if added_count > 0:
+                        logger.info(f"  - Added {added_count} unique employees from {filename}")
+                        
                 except Exception as e:
                     logger.warning(f"Error loading {filename}: {e}")
         
@@ -126,47 +236,44 @@ class EmployeeDataProcessor:
     
     def _is_valid_employee_record(self, employee: Dict) -> bool:
         """Validate that an employee record has required fields."""
-        required_fields = ['first_name', 'last_name']
-        
-        for field in required_fields:
-            value = employee.get(field, '').strip()
-            if not value or len(value) < 2:
-                return False
+        first_name = employee.get('first_name', '')
+        last_name = employee.get('last_name', '')
         
-        return True
+        # Stripping cannot lengthen a value, so short raw values are rejected
+        # before a stripped copy is made
+        return (len(first_name) >= 2 and len(last_name) >= 2 and
+                len(first_name.strip()) >= 2 and len(last_name.strip()) >= 2)
     
     def _clean_employee_record(self, employee: Dict) -> Dict:
         """Clean and standardize an employee record."""
+        get = employee.get
+        source = get('source', 'Unknown')
         cleaned = {
-            'first_name': employee.get('first_name', '').strip().title(),
-            'last_name': employee.get('last_name', '').strip().title(),
-            'title': employee.get('title', 'Unknown').strip(),
-            'source': employee.get('source', 'Unknown'),
-            'confidence': employee.get('confidence', 'low').lower(),
-            'location': employee.get('location', self.config.get('location', '')),
-            'company_name': employee.get('company_name', self.config.get('company_name', '')),
+            'first_name': get('first_name', '').strip().title(),
+            'last_name': get('last_name', '').strip().title(),
+            'title': get('title', 'Unknown').strip(),
+            # The few distinct source and confidence values are interned so
+            # every record shares one string object per value
+            'source': sys.intern(source) if isinstance(source, str) else source,
+            'confidence': sys.intern(get('confidence', 'low').lower()),
+            'location': get('location', self.default_location),
+            'company_name': get('company_name', self.default_company_name),
+            # Handle different link field names
+            'link': get('link') or get('source_link') or get('url', ''),
         }
         
-        # Handle different link field names
-        link = (employee.get('link') or 
-                employee.get('source_link') or 
-                employee.get('url', ''))
-        cleaned['link'] = link
-        
         # Ensure confidence is valid
-        if cleaned['confidence'] not in ['high', 'medium', 'low']:
+        if cleaned['confidence'] not in VALID_CONFIDENCE:
             cleaned['confidence'] = 'low'
         
         return cleaned
     
     def _sort_employees(self, employees: List[Dict]) -> List[Dict]:
         """Sort employees by confidence level and name."""
-        confidence_order = {'high': 0, 'medium': 1, 'low': 2}
-        
         return sorted(
             employees,
             key=lambda x: (
-                confidence_order.get(x.get('confidence', 'low'), 2),
+                CONFIDENCE_RANK.get(x.get('confidence', 'low'), 2),
                 x.get('last_name', ''),
                 x.get('first_name', '')
             )
@@ -176,8 +283,7 @@ class EmployeeDataProcessor:
         """Save processed employee data."""
         try:
             processed_path = self.script_dir / self.processed_data_file
-            with open(processed_path, 'w', encoding='utf-8') as f:
-                json.dump(employees, f, indent=4, ensure_ascii=False)
+            dump_json_file(processed_path, employees, self.pretty_json)
             logger.info(f"Processed data saved to {self.processed_data_file}")
             return True
         except Exception as e:
@@ -186,17 +292,8 @@ class EmployeeDataProcessor:
     
     def get_employee_stats(self) -> EmployeeStats:
         """Get statistics about the employee data."""
-        confidence_counts = {'high': 0, 'medium': 0, 'low': 0}
-        sources = {}
-        
-        for emp in self.employees:
-            # Count by confidence
-            conf = emp.get('confidence', 'low')
-            confidence_counts[conf] = confidence_counts.get(conf, 0) + 1
-            
-            # Count by source
-            source = emp.get('source', 'Unknown')
-            sources[source] = sources.get(source, 0) + 1
+        confidence_counts = Counter(emp.get('confidence', 'low') for emp in self.employees)
+        sources = Counter(emp.get('source', 'Unknown') for emp in self.employees)
         
         return EmployeeStats(
             total=len(self.employees),
@@ -224,7 +321,8 @@ class EmployeeDataProcessor:
     
     def _clear_screen(self):
         """Clear the terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        sys.stdout.write(CLEAR_SCREEN)
+        sys.stdout.flush()
     
     def _print_employee_details(self, employee: Dict, index: int, total: int) -> None:
         """Print detailed employee information for review."""
@@ -241,6 +339,19 @@ class EmployeeDataProcessor:
         print(f"Link:      {link}")
         print("=" * 60)
     
+    def _print_employee_batch(self, employees: List[Dict], start: int, total: int) -> None:
+        """Print a numbered batch of employees on one screen for bulk review."""
+        self._clear_screen()
+        print("\n" + "=" * 60)
+        print(f"Employees {start}-{start + len(employees) - 1}/{total}")
+        print("=" * 60)
+        for number, employee in enumerate(employees, 1):
+            print(f"{number:>2}. {employee.get('first_name', '')} {employee.get('last_name', '')}"
+                  f" | {employee.get('title', 'N/A')} | {employee.get('source', 'N/A')}"
+                  f" | {employee.get('confidence', 'N/A').upper()}")
+            print(f"    {employee.get('link', 'N/A')}")
+        print("=" * 60)
+    
     def review_employees(self, auto_accept_high: bool = True, 
                         review_medium: bool = False) -> List[Dict]:
         """Interactive employee data review process."""
@@ -248,10 +359,13 @@ class EmployeeDataProcessor:
         
         verified_employees = []
         
-        # Separate employees by confidence
-        high_confidence = [emp for emp in self.employees if emp.get('confidence') == 'high']
-        medium_confidence = [emp for emp in self.employees if emp.get('confidence') == 'medium']
-        low_confidence = [emp for emp in self.employees if emp.get('confidence') == 'low']
+        # Separate employees by confidence in a single pass
+        groups = defaultdict(list)
+        for emp in self.employees:
+            groups[emp.get('confidence')].append(emp)
+        high_confidence = groups['high']
+        medium_confidence = groups['medium']
+        low_confidence = groups['low']
         
         # Handle high confidence records
         if auto_accept_high and high_confidence:
@@ -273,23 +387,27 @@ class EmployeeDataProcessor:
             verified_employees.extend(medium_confidence)
             logger.info(f"Auto-accepted {len(medium_confidence)} medium confidence records")
         
-        # Handle low confidence records
+        # Handle low confidence records, several to a screen
         if low_confidence:
             logger.info("Reviewing low confidence records...")
             verified_employees.extend(
-                self._review_employee_group(low_confidence, "low confidence")
+                self._review_employee_group(low_confidence, "low confidence", REVIEW_BULK_SIZE)
             )
         
         logger.info(f"Review complete. Verified {len(verified_employees)} of {len(self.employees)} employees")
         return verified_employees
     
-    def _review_employee_group(self, employees: List[Dict], group_name: str) -> List[Dict]:
-        """Review a group of employees interactively."""
+    def _review_employee_group(self, employees: List[Dict], group_name: str,
+                               bulk_size: int = 1) -> List[Dict]:
+        """Review a group of employees interactively, bulk_size records per screen."""
         verified = []
         
         if not employees:
             return verified
         
+        if bulk_size > 1:
+            return self._review_employee_batches(employees, group_name, bulk_size)
+        
         print(f"\nReviewing {len(employees)} {group_name} records.")
         print("Options for each record:")
         print("  'y' or Enter: Keep record")
@@ -320,6 +438,52 @@ class EmployeeDataProcessor:
         
         return verified
     
+    def _review_employee_batches(self, employees: List[Dict], group_name: str,
+                                 bulk_size: int) -> List[Dict]:
+        """Review a group of employees one screen of bulk_size records at a time."""
+        verified = []
+        
+        print(f"\nReviewing {len(employees)} {group_name} records, {bulk_size} at a time.")
+        print("Options for each screen:")
+        print("  'y' or Enter: Keep all records shown")
+        print("  'n': Skip all records shown")
+        print("  Numbers, e.g. '2,5': Skip those records and keep the rest")
+        print("  'q': Keep all remaining records")
+        print("  's': Skip all remaining records")
+        
+        for start in range(0, len(employees), bulk_size):
+            batch = employees[start:start + bulk_size]
+            self._print_employee_batch(batch, start + 1, len(employees))
+            
+            while True:
+                choice = input("Keep these records? (y/n/q/s or numbers to skip): ").strip().lower()
+                
+                if choice == 'q':
+                    print("Keeping all remaining records.")
+                    verified.extend(employees[start:])
+                    return verified
+                elif choice == 's':
+                    print("Skipping all remaining records.")
+                    return verified
+                elif choice == 'n':
+                    break  # Skip this screen
+                elif choice in ['y', '']:
+                    verified.extend(batch)
+                    break
+                
+                try:
+                    skipped = {int(number) for number in choice.replace(',', ' ').split()}
+                except ValueError:
+                    skipped = None
+                if skipped and all(1 <= number <= len(batch) for number in skipped):
+                    verified.extend(employee for number, employee in enumerate(batch, 1)
+                                    if number not in skipped)
+                    break
+                
+                print(f"Please enter 'y', 'n', 'q', 's', or numbers from 1 to {len(batch)}.")
+        
+        return verified
+    
     def save_verified_data(self, verified_data: List[Dict]) -> bool:
         """Save verified employee data to JSON file."""
         try:
@@ -328,30 +492,30 @@ class EmployeeDataProcessor:
             
             if verified_path.exists():
                 logger.info("Existing verified data found, merging...")
-                with open(verified_path, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
+                existing_data = load_json_file(verified_path)
                 
                 # Merge with existing data
-                existing_ids = {self._get_employee_id(emp) for emp in existing_data}
-                combined_data = existing_data.copy()
+                employee_id = self._get_employee_id
+                existing_ids = set(map(employee_id, existing_data))
+                existing_count = len(existing_data)
                 
+                # The loaded list is only used here, so new records go straight onto it
+                final_data = existing_data
                 added_count = 0
                 for emp in verified_data:
-                    emp_id = self._get_employee_id(emp)
+                    emp_id = employee_id(emp)
                     if emp_id not in existing_ids:
-                        combined_data.append(emp)
+                        final_data.append(emp)
                         existing_ids.add(emp_id)
                         added_count += 1
                 
-                final_data = combined_data
-                logger.info(f"Merged {len(existing_data)} + {added_count} = {len(final_data)} total records")
+                logger.info(f"Merged {existing_count} + {added_count} = {len(final_data)} total records")
             else:
                 final_data = verified_data
                 logger.info(f"Saving {len(final_data)} verified records")
             
             # Save the verified data
-            with open(verified_path, 'w', encoding='utf-8') as f:
-                json.dump(final_data, f, indent=4, ensure_ascii=False)
+            dump_json_file(verified_path, final_data, self.pretty_json)
             
             logger.info(f"Verified data saved to {self.verified_data_file}")
             return True
@@ -397,83 +561,81 @@ class EmployeeDataProcessor:
         """Generate Excel report directly."""
         try:
             # Install openpyxl if needed
-            try:
-                import openpyxl
-                from openpyxl.styles import Font, PatternFill, Alignment
-            except ImportError:
-                logger.info("Installing openpyxl...")
-                subprocess.call([sys.executable, "-m", "pip", "install", "openpyxl"])
-                import openpyxl
-                from openpyxl.styles import Font, PatternFill, Alignment
+            openpyxl = load_openpyxl()
+            from openpyxl.cell import WriteOnlyCell
+            from openpyxl.styles import Font, PatternFill, Alignment
+            from openpyxl.utils import get_column_letter
             
             logger.info("Creating Excel report...")
             
-            # Create workbook
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "Employee Data"
-            
             # Headers
             headers = [
                 "First Name", "Last Name", "Job Title", 
                 "Source", "Confidence", "Link", "Location"
             ]
             
+            # Flatten employees into rows, tracking the widest value per column
+            # on the way; write-only sheets need widths before the first row
+            max_lengths = [len(header) for header in headers]
+            rows = []
+            for emp in employee_data:
+                row = (emp.get('first_name', ''), emp.get('last_name', ''), emp.get('title', ''),
+                       emp.get('source', ''), emp.get('confidence', '').upper(),
+                       emp.get('link', ''), emp.get('location', ''))
+                for col, value in enumerate(row):
+                    length = len(str(value))
+                    if length > max_lengths[col]:
+                        max_lengths[col] = length
+                rows.append(row)
+            
+            # Create workbook; write-only mode does not keep every cell in memory
+            wb = openpyxl.Workbook(write_only=True)
+            ws = wb.create_sheet("Employee Data")
+            
+            for col, max_length in enumerate(max_lengths, 1):
+                ws.column_dimensions[get_column_letter(col)].width = min(max_length + 2, 50)
+            
+            # Style objects are created once and shared by every cell that uses them
+            header_font = Font(bold=True)
+            header_fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
+            header_alignment = Alignment(horizontal="center")
+            link_font = Font(color="0000FF", underline="single")
+            confidence_fills = {
+                'HIGH': PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid"),
+                'MEDIUM': PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid"),
+            }
+            low_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+            
             # Write headers with styling
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col, value=header)
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
-                cell.alignment = Alignment(horizontal="center")
+            header_row = []
+            for header in headers:
+                cell = WriteOnlyCell(ws, value=header)
+                cell.font = header_font
+                cell.fill = header_fill
+                cell.alignment = header_alignment
+                header_row.append(cell)
+            ws.append(header_row)
             
             # Write employee data
-            for row, emp in enumerate(employee_data, 2):
-                ws.cell(row=row, column=1, value=emp.get('first_name', ''))
-                ws.cell(row=row, column=2, value=emp.get('last_name', ''))
-                ws.cell(row=row, column=3, value=emp.get('title', ''))
-                ws.cell(row=row, column=4, value=emp.get('source', ''))
-                
+            for first_name, last_name, title, source, confidence, link, location in rows:
                 # Confidence with color coding
-                conf_cell = ws.cell(row=row, column=5, value=emp.get('confidence', '').upper())
-                if conf_cell.value == 'HIGH':
-                    conf_cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-                elif conf_cell.value == 'MEDIUM':
-                    conf_cell.fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-                else:
-                    conf_cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+                conf_cell = WriteOnlyCell(ws, value=confidence)
+                conf_cell.fill = confidence_fills.get(confidence, low_fill)
                 
                 # Link with hyperlink
-                link = emp.get('link', '')
-                link_cell = ws.cell(row=row, column=6, value=link)
+                link_cell = WriteOnlyCell(ws, value=link)
                 if link:
                     link_cell.hyperlink = link
-                    link_cell.font = Font(color="0000FF", underline="single")
+                    link_cell.font = link_font
                 
-                ws.cell(row=row, column=7, value=emp.get('location', ''))
-            
-            # Auto-adjust column widths
-            for col in ws.columns:
-                max_length = 0
-                column = col[0].column_letter
-                for cell in col:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column].width = adjusted_width
+                ws.append([first_name, last_name, title, source, conf_cell, link_cell, location])
             
             # Add summary sheet
             summary_sheet = wb.create_sheet(title="Summary")
-            summary_sheet["A1"] = "Company"
-            summary_sheet["B1"] = self.config.get('company_name', '')
-            summary_sheet["A2"] = "Location"
-            summary_sheet["B2"] = self.config.get('location', '')
-            summary_sheet["A3"] = "Total Employees"
-            summary_sheet["B3"] = len(employee_data)
-            summary_sheet["A4"] = "Generated On"
-            summary_sheet["B4"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            summary_sheet.append(["Company", self.config.get('company_name', '')])
+            summary_sheet.append(["Location", self.config.get('location', '')])
+            summary_sheet.append(["Total Employees", len(employee_data)])
+            summary_sheet.append(["Generated On", datetime.now().strftime("%Y-%m-%d %H:%M:%S")])
             
             # Save Excel file
             company_name = self.config.get('company_name', 'Company').replace(' ', '_')
@@ -518,8 +680,8 @@ def main():
         print("EMPLOYEE DATA REVIEW AND VALIDATION (ENHANCED)")
         print("=" * 60)
         
-        # Initialize processor
-        processor = EmployeeDataProcessor(str(config_path))
+        # Initialize processor; --pretty writes indented JSON files
+        processor = EmployeeDataProcessor(str(config_path), pretty_json='--pretty' in sys.argv[1:])
         
         # Display summary
         processor.display_summary()
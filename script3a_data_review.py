@@ -13,9 +13,11 @@ import os
 import subprocess
 import sys
 import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, Sequence, Set, Tuple
 
 # Configure logging
 logging.basicConfig(
@@ -24,6 +26,60 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# orjson is optional; it parses and serialises employee lists much faster than json
+try:
+    import orjson
+    _json_loads = orjson.loads
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _json_loads = json.loads
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+def _write_file_atomic(file_path: Path, payload: bytes) -> None:
+    """Write payload to a temporary file beside file_path, then swap it into place."""
+    tmp_path = file_path.with_name(file_path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        # Do not leave a partial temporary file beside the data files
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+# Employee data files read after script3's verified data, in merge priority order
+POTENTIAL_DATA_FILES = (
+    "merged_employees.json",
+    "linkedin_employees.json",
+    "website_employees.json",
+    "script2a_employees.json",
+    "temp_employee_data.json",
+    "url_processed_employees.json",
+    "processed_employee_data.json",
+)
+
+# Sort rank of each confidence level
+CONFIDENCE_RANK = {'high': 0, 'medium': 1, 'low': 2}
+
+# ijson is optional; it streams records out of large input files one at a time
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Input files from this size up are streamed when ijson is installed
+LARGE_JSON_FILE = 64 * 1024 * 1024
+
+def _iter_json_records(file_path: Path) -> Iterator[Dict]:
+    """Stream the records of a JSON array file; other JSON roots yield nothing."""
+    with open(file_path, 'rb') as f:
+        yield from ijson.items(f, 'item', use_float=True)
+
 class SimplifiedDataReviewer:
     """Simplified employee data reviewer with minimal dependencies."""
     
@@ -35,6 +91,11 @@ class SimplifiedDataReviewer:
         # File paths
         self.verified_data_file = "verified_employee_data.json"
         self.script3a_output_file = "script3a_verified_employees.json"
+        self.verified_data_path = self.script_dir / self.verified_data_file
+        self.script3a_output_path = self.script_dir / self.script3a_output_file
+        
+        # Every input file, in merge priority order
+        self.data_files = (self.verified_data_file,) + POTENTIAL_DATA_FILES
         
         # Load employees from all sources
         self.employees = self._load_all_employee_data()
@@ -42,72 +103,69 @@ class SimplifiedDataReviewer:
     def _load_config(self, config_path: str) -> dict:
         """Load configuration from JSON file."""
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _json_loads(Path(config_path).read_bytes())
         except (FileNotFoundError, json.JSONDecodeError) as e:
             logger.error(f"Configuration error: {e}")
             sys.exit(1)
     
-    def _get_employee_id(self, employee: Dict) -> str:
+    def _get_employee_id(self, employee: Dict) -> Tuple[str, str]:
         """Generate a unique ID for an employee to detect duplicates."""
-        first_name = employee.get('first_name', '').lower().strip()
-        last_name = employee.get('last_name', '').lower().strip()
-        return f"{first_name}_{last_name}"
+        return (employee.get('first_name', '').lower().strip(),
+                employee.get('last_name', '').lower().strip())
     
     def _load_all_employee_data(self) -> List[Dict]:
         """Load employee data from all available sources."""
         logger.info("Loading employee data from all sources...")
         
         all_employees = []
-        processed_ids = set()
+        processed_ids: Set[Tuple[str, str]] = set()
+        
+        # Read and parse every file up front in parallel; records are still
+        # merged below in priority order
+        parsed_files = self._read_data_files(self.data_files)
         
         # Check if script3's verified data exists first
-        script3_verified_path = self.script_dir / self.verified_data_file
-        if script3_verified_path.exists():
+        if self.verified_data_file in parsed_files:
             try:
-                with open(script3_verified_path, 'r', encoding='utf-8') as f:
-                    script3_data = json.load(f)
-                logger.info(f"Found script3's verified data: {len(script3_data)} employees")
+                script3_data = parsed_files[self.verified_data_file]
+                if isinstance(script3_data, Exception):
+                    raise script3_data
                 
                 # Add script3's verified employees first
+                loaded_count = 0
                 for emp in script3_data:
+                    loaded_count += 1
                     emp_id = self._get_employee_id(emp)
                     if emp_id and emp_id not in processed_ids:
                         all_employees.append(self._clean_employee_record(emp))
                         processed_ids.add(emp_id)
+                logger.info(f"Found script3's verified data: {loaded_count} employees")
             except Exception as e:
                 logger.warning(f"Error loading script3's verified data: {e}")
         
         # Check all other potential data files
-        potential_files = [
-            "merged_employees.json",
-            "linkedin_employees.json",
-            "website_employees.json",
-            "script2a_employees.json",
-            "temp_employee_data.json",
-            "url_processed_employees.json",
-            "processed_employee_data.json"
-        ]
-        
-        for filename in potential_files:
-            file_path = self.script_dir / filename
-            if file_path.exists():
+        for filename in POTENTIAL_DATA_FILES:
+            if filename in parsed_files:
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    data = parsed_files[filename]
+                    if isinstance(data, Exception):
+                        raise data
                     
-                    if isinstance(data, list) and data:
-                        logger.info(f"Loaded {len(data)} employees from {filename}")
-                        
+                    if isinstance(data, (list, Iterator)):
                         # Add unique employees
+                        loaded_count = 0
                         added_count = 0
                         for emp in data:
+                            loaded_count += 1
                             emp_id = self._get_employee_id(emp)
                             if emp_id and emp_id not in processed_ids:
                                 all_employees.append(self._clean_employee_record(emp))
                                 processed_ids.add(emp_id)
                                 added_count += 1
                         
+                        if loaded_count:
+                            logger.info(f"Loaded {loaded_count} employees from {filename}")
+                        
                         if added_count > 0:
                             logger.info(f"  - Added {added_count} unique employees from {filename}")
                             
@@ -123,6 +181,37 @@ class SimplifiedDataReviewer:
         # Sort by confidence and name
         return self._sort_employees(all_employees)
     
+    def _read_data_files(self, filenames: Sequence[str]) -> Dict[str, object]:
+        """Read and parse the existing files among filenames concurrently.
+        
+        Maps each existing filename to its parsed JSON, or to the exception
+        raised while reading it so one bad file does not stop the others.
+        Large files are left to be streamed record by record by the caller.
+        """
+        # One directory listing instead of an exists() call per candidate
+        wanted = set(filenames)
+        try:
+            with os.scandir(self.script_dir) as it:
+                entries = {entry.name: entry for entry in it if entry.name in wanted}
+        except OSError as e:
+            logger.warning(f"Error listing {self.script_dir}: {e}")
+            return {}
+        existing = [filename for filename in filenames if filename in entries]
+        if not existing:
+            return {}
+        
+        def read(filename: str):
+            entry = entries[filename]
+            try:
+                if ijson is not None and entry.stat().st_size >= LARGE_JSON_FILE:
+                    return _iter_json_records(Path(entry.path))
+                return _json_loads(Path(entry.path).read_bytes())
+            except Exception as e:
+                return e
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(existing))) as pool:
+            return dict(zip(existing, pool.map(read, existing)))
+    
     def _clean_employee_record(self, employee: Dict) -> Dict:
         """Clean and standardize an employee record."""
         cleaned = {
@@ -147,17 +236,33 @@ class SimplifiedDataReviewer:
         
         return cleaned
     
+    def has_linkedin_profile(self, employee: Dict) -> bool:
+        """Return whether an employee record links to a LinkedIn profile."""
+        link = employee.get('link')
+        return bool(link) and 'linkedin.com/in/' in link.lower()
+    
+    def summarize_employees(self, employees: List[Dict]) -> Tuple[Counter, Counter, int]:
+        """Count employees per source and per confidence level, plus LinkedIn profiles."""
+        sources = Counter()
+        confidence_counts = Counter()
+        linkedin_count = 0
+        
+        for emp in employees:
+            sources[emp.get('source', 'Unknown')] += 1
+            confidence_counts[emp.get('confidence', 'low')] += 1
+            linkedin_count += self.has_linkedin_profile(emp)
+        
+        return sources, confidence_counts, linkedin_count
+    
     def _sort_employees(self, employees: List[Dict]) -> List[Dict]:
-        """Sort employees by confidence level and name."""
-        confidence_order = {'high': 0, 'medium': 1, 'low': 2}
+        """Sort employees by confidence level and name.
         
+        The records come from _clean_employee_record, so every key is present
+        and confidence is always one of the ranked levels.
+        """
         return sorted(
             employees,
-            key=lambda x: (
-                confidence_order.get(x.get('confidence', 'low'), 2),
-                x.get('last_name', ''),
-                x.get('first_name', '')
-            )
+            key=lambda x: (CONFIDENCE_RANK[x['confidence']], x['last_name'], x['first_name'])
         )
     
     def _clear_screen(self):
@@ -183,10 +288,13 @@ class SimplifiedDataReviewer:
         """Interactive employee data review process."""
         verified_employees = []
         
-        # Separate employees by confidence
-        high_confidence = [emp for emp in self.employees if emp.get('confidence') == 'high']
-        medium_confidence = [emp for emp in self.employees if emp.get('confidence') == 'medium']
-        low_confidence = [emp for emp in self.employees if emp.get('confidence') == 'low']
+        # Separate employees by confidence in a single pass
+        groups = defaultdict(list)
+        for emp in self.employees:
+            groups[emp.get('confidence')].append(emp)
+        high_confidence = groups['high']
+        medium_confidence = groups['medium']
+        low_confidence = groups['low']
         
         print(f"\nFound {len(high_confidence)} high confidence records")
         print(f"Found {len(medium_confidence)} medium confidence records")
@@ -233,7 +341,8 @@ class SimplifiedDataReviewer:
         print("  'q': Keep all remaining records")
         print("  's': Skip all remaining records")
         
-        for i, employee in enumerate(employees, 1):
+        remaining = iter(employees)
+        for i, employee in enumerate(remaining, 1):
             self._print_employee_details(employee, i, len(employees))
             
             while True:
@@ -241,7 +350,8 @@ class SimplifiedDataReviewer:
                 
                 if choice == 'q':
                     print("Keeping all remaining records.")
-                    verified.extend(employees[i-1:])
+                    verified.append(employee)
+                    verified.extend(remaining)
                     return verified
                 elif choice == 's':
                     print("Skipping all remaining records.")
@@ -259,42 +369,42 @@ class SimplifiedDataReviewer:
     def save_verified_data(self, verified_data: List[Dict]) -> bool:
         """Save verified employee data to JSON files."""
         try:
+            # Serialise once; the same bytes may serve both output files
+            payload = _json_dumps(verified_data)
+            
             # Save to script3a-specific output file
-            script3a_output_path = self.script_dir / self.script3a_output_file
-            with open(script3a_output_path, 'w', encoding='utf-8') as f:
-                json.dump(verified_data, f, indent=4, ensure_ascii=False)
+            _write_file_atomic(self.script3a_output_path, payload)
             logger.info(f"Data saved to {self.script3a_output_file}")
             
             # Handle the standard verified_data_file
-            verified_path = self.script_dir / self.verified_data_file
+            verified_path = self.verified_data_path
             if verified_path.exists():
                 logger.info("Merging with existing verified data...")
                 
                 # Load existing verified data
-                with open(verified_path, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
+                existing_data = _json_loads(verified_path.read_bytes())
                 
-                # Combine with our data, avoiding duplicates
-                existing_ids = {self._get_employee_id(emp) for emp in existing_data}
-                combined_data = existing_data.copy()
+                # Combine with our data, avoiding duplicates; the loaded list is
+                # extended in place since it is rewritten right after
+                get_id = self._get_employee_id
+                existing_ids = {get_id(emp) for emp in existing_data}
+                existing_count = len(existing_data)
                 
                 added_count = 0
                 for emp in verified_data:
-                    emp_id = self._get_employee_id(emp)
+                    emp_id = get_id(emp)
                     if emp_id not in existing_ids:
-                        combined_data.append(emp)
+                        existing_data.append(emp)
                         existing_ids.add(emp_id)
                         added_count += 1
                 
                 # Save the combined data
-                with open(verified_path, 'w', encoding='utf-8') as f:
-                    json.dump(combined_data, f, indent=4, ensure_ascii=False)
+                _write_file_atomic(verified_path, _json_dumps(existing_data))
                 
-                logger.info(f"Combined {len(existing_data)} + {added_count} = {len(combined_data)} total records")
+                logger.info(f"Combined {existing_count} + {added_count} = {len(existing_data)} total records")
             else:
                 # Save our data as the verified data
-                with open(verified_path, 'w', encoding='utf-8') as f:
-                    json.dump(verified_data, f, indent=4, ensure_ascii=False)
+                _write_file_atomic(verified_path, payload)
                 logger.info(f"Saved {len(verified_data)} records to {self.verified_data_file}")
             
             return True
@@ -315,13 +425,15 @@ class SimplifiedDataReviewer:
                 subprocess.call([sys.executable, "-m", "pip", "install", "openpyxl"])
                 import openpyxl
                 from openpyxl.styles import Font, PatternFill, Alignment
+            from openpyxl.cell import WriteOnlyCell
+            from openpyxl.utils import get_column_letter
             
             logger.info("Creating Excel report...")
             
-            # Create workbook
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "Employee Data"
+            # Create workbook; write-only mode streams rows instead of keeping
+            # every cell in memory
+            wb = openpyxl.Workbook(write_only=True)
+            ws = wb.create_sheet("Employee Data")
             
             # Headers
             headers = [
@@ -329,61 +441,64 @@ class SimplifiedDataReviewer:
                 "Source", "Confidence", "Link", "Location"
             ]
             
+            # Flatten employees into rows, tracking the widest value per column
+            # on the way; write-only sheets need widths before the first row
+            max_lengths = [len(header) for header in headers]
+            rows = []
+            for emp in employee_data:
+                row = (emp.get('first_name', ''), emp.get('last_name', ''), emp.get('title', ''),
+                       emp.get('source', ''), emp.get('confidence', '').upper(),
+                       emp.get('link', ''), emp.get('location', ''))
+                for col, value in enumerate(row):
+                    length = len(str(value))
+                    if length > max_lengths[col]:
+                        max_lengths[col] = length
+                rows.append(row)
+            
+            for col, max_length in enumerate(max_lengths, 1):
+                ws.column_dimensions[get_column_letter(col)].width = min(max_length + 2, 50)
+            
+            # Style objects are created once and shared by every cell that uses them
+            header_font = Font(bold=True)
+            header_fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
+            header_alignment = Alignment(horizontal="center")
+            link_font = Font(color="0000FF", underline="single")
+            confidence_fills = {
+                'HIGH': PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid"),
+                'MEDIUM': PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid"),
+            }
+            low_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+            
             # Write headers with styling
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col, value=header)
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
-                cell.alignment = Alignment(horizontal="center")
+            header_row = []
+            for header in headers:
+                cell = WriteOnlyCell(ws, value=header)
+                cell.font = header_font
+                cell.fill = header_fill
+                cell.alignment = header_alignment
+                header_row.append(cell)
+            ws.append(header_row)
             
-            # Write employee data
-            for row, emp in enumerate(employee_data, 2):
-                ws.cell(row=row, column=1, value=emp.get('first_name', ''))
-                ws.cell(row=row, column=2, value=emp.get('last_name', ''))
-                ws.cell(row=row, column=3, value=emp.get('title', ''))
-                ws.cell(row=row, column=4, value=emp.get('source', ''))
-                
+            # Write employee data; only the two styled columns need cell objects
+            for first_name, last_name, title, source, confidence, link, location in rows:
                 # Confidence with color coding
-                conf_cell = ws.cell(row=row, column=5, value=emp.get('confidence', '').upper())
-                if conf_cell.value == 'HIGH':
-                    conf_cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-                elif conf_cell.value == 'MEDIUM':
-                    conf_cell.fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-                else:
-                    conf_cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+                conf_cell = WriteOnlyCell(ws, value=confidence)
+                conf_cell.fill = confidence_fills.get(confidence, low_fill)
                 
                 # Link with hyperlink
-                link = emp.get('link', '')
-                link_cell = ws.cell(row=row, column=6, value=link)
+                link_cell = WriteOnlyCell(ws, value=link)
                 if link:
                     link_cell.hyperlink = link
-                    link_cell.font = Font(color="0000FF", underline="single")
+                    link_cell.font = link_font
                 
-                ws.cell(row=row, column=7, value=emp.get('location', ''))
-            
-            # Auto-adjust column widths
-            for col in ws.columns:
-                max_length = 0
-                column = col[0].column_letter
-                for cell in col:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column].width = adjusted_width
+                ws.append([first_name, last_name, title, source, conf_cell, link_cell, location])
             
             # Add summary sheet
             summary_sheet = wb.create_sheet(title="Summary")
-            summary_sheet["A1"] = "Company"
-            summary_sheet["B1"] = self.config.get('company_name', '')
-            summary_sheet["A2"] = "Location"
-            summary_sheet["B2"] = self.config.get('location', '')
-            summary_sheet["A3"] = "Total Employees"
-            summary_sheet["B3"] = len(employee_data)
-            summary_sheet["A4"] = "Generated On"
-            summary_sheet["B4"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            summary_sheet.append(["Company", self.config.get('company_name', '')])
+            summary_sheet.append(["Location", self.config.get('location', '')])
+            summary_sheet.append(["Total Employees", len(employee_data)])
+            summary_sheet.append(["Generated On", datetime.now().strftime("%Y-%m-%d %H:%M:%S")])
             
             # Save Excel file
             company_name = self.config.get('company_name', 'Company').replace(' ', '_')
@@ -431,9 +546,7 @@ class SimplifiedDataReviewer:
                     # Special handling for LinkedIn verification
                     if script_name == "script5_linkedin_verification.py":
                         # Check if we have LinkedIn profiles first
-                        linkedin_count = sum(1 for emp in self.employees 
-                                           if (emp.get('link', '') or emp.get('source_link', '')) 
-                                           and 'linkedin.com/in/' in (emp.get('link', '') or emp.get('source_link', '')).lower())
+                        linkedin_count = sum(1 for emp in self.employees if self.has_linkedin_profile(emp))
                         
                         if linkedin_count == 0:
                             logger.info("No LinkedIn profiles found, skipping Script 5")
@@ -448,6 +561,10 @@ class SimplifiedDataReviewer:
                             creationflags=subprocess.CREATE_NEW_CONSOLE,
                             env=env
                         )
+                    elif hasattr(os, 'posix_spawn'):
+                        # Spawn without forking a copy of this process and its
+                        # loaded employee data first
+                        os.posix_spawn(sys.executable, [sys.executable, str(script_path), "--auto"], env)
                     else:
                         subprocess.Popen([sys.executable, str(script_path), "--auto"], env=env)
                     return True
@@ -483,24 +600,10 @@ def main():
         print(f"Total employees found: {len(reviewer.employees)}")
         
         # Count by source and confidence
-        sources = {}
-        confidence_counts = {'high': 0, 'medium': 0, 'low': 0}
-        linkedin_count = 0
-        
-        for emp in reviewer.employees:
-            source = emp.get('source', 'Unknown')
-            sources[source] = sources.get(source, 0) + 1
-            
-            conf = emp.get('confidence', 'low')
-            confidence_counts[conf] = confidence_counts.get(conf, 0) + 1
-            
-            # Count LinkedIn profiles
-            link = emp.get('link', '') or emp.get('source_link', '')
-            if link and 'linkedin.com/in/' in link.lower():
-                linkedin_count += 1
+        sources, confidence_counts, linkedin_count = reviewer.summarize_employees(reviewer.employees)
         
         print("\nEmployee sources:")
-        for source, count in sorted(sources.items(), key=lambda x: x[1], reverse=True):
+        for source, count in sources.most_common():
             print(f"  - {source}: {count} employees")
         
         print(f"\nConfidence levels:")
@@ -532,23 +635,10 @@ def main():
                 print("Excel report generated successfully!")
                 
                 # Show final statistics
-                final_sources = {}
-                final_confidence = {'high': 0, 'medium': 0, 'low': 0}
-                final_linkedin = 0
-                
-                for emp in verified_employees:
-                    source = emp.get('source', 'Unknown')
-                    final_sources[source] = final_sources.get(source, 0) + 1
-                    
-                    conf = emp.get('confidence', 'low')
-                    final_confidence[conf] = final_confidence.get(conf, 0) + 1
-                    
-                    link = emp.get('link', '') or emp.get('source_link', '')
-                    if link and 'linkedin.com/in/' in link.lower():
-                        final_linkedin += 1
+                final_sources, _, final_linkedin = reviewer.summarize_employees(verified_employees)
                 
                 print("\nFinal Excel report contains:")
-                for source, count in sorted(final_sources.items(), key=lambda x: x[1], reverse=True):
+                for source, count in final_sources.most_common():
                     print(f"  - {source}: {count} employees")
                 
                 if final_linkedin > 0:
@@ -16,7 +16,7 @@ import sys
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Set, Tuple, Optional
+from typing import List, Dict, Set, Tuple, Optional, Union
 from dataclasses import dataclass
 
 # Configure logging
@@ -26,6 +26,99 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# orjson is optional; it parses and serialises employee lists much faster than json
+try:
+    import orjson
+    _json_loads = orjson.loads
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _json_loads = json.loads
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Values of the optional "nlp_backend" config key:
+#   spacy        - en_core_web_sm entity recognition (default)
+#   entity_ruler - a blank spaCy pipeline tagging PERSON from the name databases
+#   rules        - no model; capitalisation only (also accepted as "rules_only")
+NLP_BACKENDS = ("spacy", "entity_ruler", "rules")
+NLP_BACKEND_ALIASES = {"rules_only": "rules"}
+
+# spaCy components never used: only the named entities of a parse are read
+UNUSED_NLP_PIPES = ["tagger", "parser", "senter", "attribute_ruler", "lemmatizer"]
+
+# Fallback name databases, written out when first_names.txt / last_names.txt are missing
+COMMON_FIRST_NAMES = frozenset((
+    # Male names
+    "james", "john", "robert", "michael", "william", "david", "richard", "joseph",
+    "thomas", "christopher", "charles", "daniel", "matthew", "anthony", "mark",
+    "donald", "steven", "paul", "andrew", "joshua", "kenneth", "kevin", "brian",
+    "george", "timothy", "ronald", "jason", "edward", "jeffrey", "ryan", "jacob",
+    "gary", "nicholas", "eric", "jonathan", "stephen", "larry", "justin", "scott",
+    "brandon", "benjamin", "samuel", "gregory", "alexander", "patrick", "frank",
+    "raymond", "jack", "dennis", "jerry", "tyler", "aaron", "jose", "henry", "adam",
+    "douglas", "nathan", "peter", "zachary", "kyle", "noah", "alan", "ethan",
+    "jeremy", "lionel", "angel", "jordan", "wayne", "arthur", "mason", "roy",
+    "ralph", "eugene", "louis", "philip", "bobby", "harold", "lawrence",
+
+    # Female names
+    "mary", "patricia", "jennifer", "linda", "elizabeth", "barbara", "susan",
+    "jessica", "sarah", "karen", "nancy", "lisa", "betty", "helen", "sandra",
+    "donna", "carol", "ruth", "sharon", "michelle", "laura", "kimberly", "deborah",
+    "dorothy", "emily", "amy", "angela", "ashley", "brenda", "emma", "olivia",
+    "cynthia", "marie", "janet", "catherine", "frances", "christine", "samantha",
+    "debra", "rachel", "carolyn", "virginia", "maria", "heather", "diane", "julie",
+    "joyce", "victoria", "kelly", "christina", "joan", "evelyn", "lauren", "judith",
+    "megan", "cheryl", "andrea", "hannah", "jacqueline", "martha", "gloria",
+    "teresa", "sara", "janice", "julia", "katherine", "alice", "madison", "abigail",
+    "stephanie",
+
+    # Modern/International names
+    "aiden", "liam", "lucas", "oliver", "sophia", "isabella", "ava", "mia",
+    "charlotte", "harper", "sofia", "avery", "ella", "scarlett", "grace", "chloe",
+    "riley", "aria", "lily", "aubrey", "zoey", "penelope", "lillian", "addison",
+    "layla", "natalie", "camila", "brooklyn", "zoe", "nora", "leah"
+))
+
+COMMON_LAST_NAMES = frozenset((
+    "smith", "johnson", "williams", "jones", "brown", "davis", "miller", "wilson",
+    "moore", "taylor", "anderson", "thomas", "jackson", "white", "harris", "martin",
+    "thompson", "garcia", "martinez", "robinson", "clark", "rodriguez", "lewis",
+    "lee", "walker", "hall", "allen", "young", "hernandez", "king", "wright",
+    "lopez", "hill", "scott", "green", "adams", "baker", "gonzalez", "nelson",
+    "carter", "mitchell", "perez", "roberts", "turner", "phillips", "campbell",
+    "parker", "evans", "edwards", "collins", "stewart", "sanchez", "morris",
+    "rogers", "reed", "cook", "morgan", "bell", "murphy", "bailey", "rivera",
+    "cooper", "richardson", "cox", "howard", "ward", "torres", "peterson", "gray",
+    "ramirez", "james", "watson", "brooks", "kelly", "sanders", "price", "bennett",
+    "wood", "barnes", "ross", "henderson", "coleman", "jenkins", "perry", "powell",
+    "long", "patterson", "hughes", "flores", "washington", "butler", "simmons",
+    "foster", "gonzales", "bryant", "alexander", "russell", "griffin", "diaz",
+    "hayes", "myers", "ford", "hamilton", "graham", "sullivan", "wallace", "woods",
+    "cole", "west", "jordan", "owens", "reynolds", "fisher", "ellis", "harrison",
+    "gibson", "mcdonald", "cruz", "marshall", "ortiz", "gomez", "murray", "freeman",
+    "wells", "webb", "simpson", "stevens", "tucker", "porter", "hunter", "hicks",
+    "crawford", "henry", "boyd", "mason", "morales", "kennedy", "warren", "dixon",
+    "ramos", "reyes", "burns", "gordon", "shaw", "holmes", "rice", "robertson",
+    "hunt", "black", "daniels", "palmer", "mills", "nichols", "grant", "knight",
+
+    # UK-specific surnames
+    "clarke", "davies"
+))
+
+# Names handed to the NLP model per batch by validate_all_employees
+NLP_BATCH_SIZE = 128
+
+# Characters allowed in a first or last name
+NAME_CHARS_RE = re.compile(r"^[a-zA-Z\-']+\Z")
+
+# A capitalised word followed by a street or place suffix, e.g. "Rose Street"
+LOCATION_PATTERN_RE = re.compile(
+    r'\b[A-Z][a-z]+ (?:Street|Road|Avenue|Lane|Drive|Place|Square|Terrace|Gardens|Park|Close|Way|Court|Crescent'
+    r'|Row|Mews|Circle|Heights|Hill|Estate|Acres|Bridge|Village|Gate|Cross|Plaza|Yard|Wharf|Quay)\b',
+    re.IGNORECASE
+)
+
 @dataclass
 class ValidationResult:
     """Result of name validation."""
@@ -45,53 +138,96 @@ class NameValidator:
         self.verified_data_file = "verified_employee_data.json"
         self.validated_output_file = "validated_employees.json"
         
-        # Initialize validation resources
-        self._ensure_dependencies()
-        self.nlp_model = self._load_nlp_model()
-        
         # Load name databases
         self.common_first_names = self._load_name_database('first_names.txt')
         self.common_last_names = self._load_name_database('last_names.txt')
         
+        # Initialize validation resources; the entity_ruler backend is built
+        # from the name databases, so they are loaded first
+        nlp_backend = self.config.get('nlp_backend', 'spacy')
+        self.nlp_backend = NLP_BACKEND_ALIASES.get(nlp_backend, nlp_backend)
+        if self.nlp_backend not in NLP_BACKENDS:
+            logger.warning(f"Unknown nlp_backend '{self.nlp_backend}', using spacy")
+            self.nlp_backend = 'spacy'
+        self._ensure_dependencies()
+        self.nlp_model = self._load_nlp_model()
+        
         # Load custom exceptions
         self.custom_exceptions = self._load_custom_exceptions()
         
         # Known false positives
         self.false_positives = self._get_false_positives()
         
+        # validate_name results by (first_name, last_name); duplicate names
+        # across sources are only validated once
+        self._validation_cache: Dict[Tuple[str, str], ValidationResult] = {}
+        
         # Load employee data
         self.employees = self._load_employee_data()
     
     def _load_config(self, config_path: str) -> dict:
         """Load configuration from JSON file."""
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _json_loads(Path(config_path).read_bytes())
         except (FileNotFoundError, json.JSONDecodeError) as e:
             logger.error(f"Configuration error: {e}")
             sys.exit(1)
     
     def _ensure_dependencies(self):
         """Ensure required packages are installed."""
+        if self.nlp_backend == 'rules':
+            return
+        
+        # The entity_ruler backend needs spaCy itself but no trained model
+        need_model = self.nlp_backend == 'spacy'
         try:
             import spacy
-            # Try to load the model
-            try:
-                nlp = spacy.load("en_core_web_sm")
-                logger.info("spaCy model loaded successfully")
-            except OSError:
+            # Check the model is installed; _load_nlp_model does the actual load
+            if not need_model:
+                return
+            if spacy.util.is_package("en_core_web_sm"):
+                logger.info("spaCy model is installed")
+            else:
                 logger.info("Installing spaCy English model...")
                 subprocess.call([sys.executable, "-m", "spacy", "download", "en_core_web_sm"])
         except ImportError:
             logger.info("Installing spaCy...")
             subprocess.call([sys.executable, "-m", "pip", "install", "spacy"])
-            subprocess.call([sys.executable, "-m", "spacy", "download", "en_core_web_sm"])
+            if need_model:
+                subprocess.call([sys.executable, "-m", "spacy", "download", "en_core_web_sm"])
     
     def _load_nlp_model(self):
         """Load the spaCy NLP model for advanced name validation."""
+        if self.nlp_backend == 'rules':
+            logger.info("Using rule-based validation only (nlp_backend: rules)")
+            return None
+        
         try:
             import spacy
-            nlp = spacy.load("en_core_web_sm")
+            
+            if self.nlp_backend == 'entity_ruler':
+                # Token patterns are matched directly; no statistical model runs.
+                # Each pattern pairs one known part with any capitalised word,
+                # so names with only one part in the databases are tagged too
+                first_names = sorted(self.common_first_names)
+                last_names = sorted(self.common_last_names)
+                capitalised = {"TEXT": {"REGEX": "^[A-Z]"}}
+                nlp = spacy.blank("en")
+                ruler = nlp.add_pipe("entity_ruler")
+                ruler.add_patterns([
+                    {"label": "PERSON", "pattern": [{"LOWER": {"IN": first_names}}, capitalised]},
+                    {"label": "PERSON", "pattern": [capitalised, {"LOWER": {"IN": last_names}}]},
+                ])
+                logger.info("Entity ruler loaded for name validation")
+                return nlp
+            
+            nlp = spacy.load("en_core_web_sm", exclude=UNUSED_NLP_PIPES)
+            
+            # The shared tok2vec only matters if the entity recogniser listens to it
+            if "tok2vec" in nlp.pipe_names and "ner" in nlp.pipe_names:
+                listeners = getattr(nlp.get_pipe("tok2vec"), "listening_components", ["ner"])
+                if "ner" not in listeners:
+                    nlp.disable_pipe("tok2vec")
             logger.info("NLP model loaded for advanced validation")
             return nlp
         except Exception as e:
@@ -130,82 +266,22 @@ class NameValidator:
     
     def _get_common_first_names(self) -> Set[str]:
         """Get a comprehensive list of common first names."""
-        return {
-            # Male names
-            "james", "john", "robert", "michael", "william", "david", "richard", "joseph", 
-            "thomas", "christopher", "charles", "daniel", "matthew", "anthony", "mark", 
-            "donald", "steven", "paul", "andrew", "joshua", "kenneth", "kevin", "brian",
-            "george", "timothy", "ronald", "jason", "edward", "jeffrey", "ryan", "jacob",
-            "gary", "nicholas", "eric", "jonathan", "stephen", "larry", "justin", "scott",
-            "brandon", "benjamin", "samuel", "gregory", "alexander", "patrick", "frank",
-            "raymond", "jack", "dennis", "jerry", "tyler", "aaron", "jose", "henry",
-            "adam", "douglas", "nathan", "peter", "zachary", "kyle", "noah", "alan",
-            "ethan", "jeremy", "lionel", "angel", "jordan", "wayne", "arthur", "mason",
-            "roy", "ralph", "eugene", "louis", "philip", "bobby", "harold", "lawrence",
-            
-            # Female names
-            "mary", "patricia", "jennifer", "linda", "elizabeth", "barbara", "susan",
-            "jessica", "sarah", "karen", "nancy", "lisa", "betty", "helen", "sandra",
-            "donna", "carol", "ruth", "sharon", "michelle", "laura", "sarah", "kimberly",
-            "deborah", "dorothy", "lisa", "nancy", "karen", "betty", "helen", "sandra",
-            "donna", "carol", "ruth", "sharon", "michelle", "laura", "emily", "kimberly",
-            "deborah", "dorothy", "amy", "angela", "ashley", "brenda", "emma", "olivia",
-            "cynthia", "marie", "janet", "catherine", "frances", "christine", "samantha",
-            "debra", "rachel", "carolyn", "janet", "virginia", "maria", "heather", "diane",
-            "julie", "joyce", "victoria", "kelly", "christina", "joan", "evelyn", "lauren",
-            "judith", "megan", "cheryl", "andrea", "hannah", "jacqueline", "martha", "gloria",
-            "teresa", "sara", "janice", "marie", "julia", "heather", "katherine", "alice",
-            "madison", "julia", "katherine", "alice", "madison", "abigail", "stephanie",
-            "carolyn", "janet", "virginia", "maria", "heather", "diane", "julie", "joyce",
-            
-            # Modern/International names
-            "aiden", "liam", "noah", "ethan", "mason", "lucas", "oliver", "jacob", "emma",
-            "sophia", "isabella", "ava", "mia", "emily", "abigail", "madison", "charlotte",
-            "harper", "sofia", "avery", "ella", "scarlett", "grace", "chloe", "victoria",
-            "riley", "aria", "lily", "aubrey", "zoey", "penelope", "lillian", "addison",
-            "layla", "natalie", "camila", "hannah", "brooklyn", "zoe", "nora", "leah"
-        }
+        return set(COMMON_FIRST_NAMES)
     
     def _get_common_last_names(self) -> Set[str]:
         """Get a comprehensive list of common last names."""
-        return {
-            "smith", "johnson", "williams", "jones", "brown", "davis", "miller", "wilson",
-            "moore", "taylor", "anderson", "thomas", "jackson", "white", "harris", "martin",
-            "thompson", "garcia", "martinez", "robinson", "clark", "rodriguez", "lewis",
-            "lee", "walker", "hall", "allen", "young", "hernandez", "king", "wright",
-            "lopez", "hill", "scott", "green", "adams", "baker", "gonzalez", "nelson",
-            "carter", "mitchell", "perez", "roberts", "turner", "phillips", "campbell",
-            "parker", "evans", "edwards", "collins", "stewart", "sanchez", "morris",
-            "rogers", "reed", "cook", "morgan", "bell", "murphy", "bailey", "rivera",
-            "cooper", "richardson", "cox", "howard", "ward", "torres", "peterson", "gray",
-            "ramirez", "james", "watson", "brooks", "kelly", "sanders", "price", "bennett",
-            "wood", "barnes", "ross", "henderson", "coleman", "jenkins", "perry", "powell",
-            "long", "patterson", "hughes", "flores", "washington", "butler", "simmons",
-            "foster", "gonzales", "bryant", "alexander", "russell", "griffin", "diaz",
-            "hayes", "myers", "ford", "hamilton", "graham", "sullivan", "wallace", "woods",
-            "cole", "west", "jordan", "owens", "reynolds", "fisher", "ellis", "harrison",
-            "gibson", "mcdonald", "cruz", "marshall", "ortiz", "gomez", "murray", "freeman",
-            "wells", "webb", "simpson", "stevens", "tucker", "porter", "hunter", "hicks",
-            "crawford", "henry", "boyd", "mason", "morales", "kennedy", "warren", "dixon",
-            "ramos", "reyes", "burns", "gordon", "shaw", "holmes", "rice", "robertson",
-            "hunt", "black", "daniels", "palmer", "mills", "nichols", "grant", "knight",
-            
-            # UK-specific surnames
-            "clarke", "davies", "evans", "hughes", "roberts", "wright", "walker", "robinson",
-            "thompson", "taylor", "white", "anderson", "harris", "clark", "lewis", "scott",
-            "jones", "williams", "wilson", "brown", "johnson", "smith", "miller", "davis",
-            "thomas", "jackson", "martin", "hall", "allen", "adams", "baker", "carter",
-            "mitchell", "phillips", "campbell", "parker", "turner", "edwards", "collins",
-            "stewart", "ward", "bell", "murphy", "cooper", "richardson", "bennett", "brooks",
-            "kelly", "sanders", "wood", "barnes", "ross", "henderson", "jenkins", "perry",
-            "powell", "long", "patterson", "hughes", "russell", "griffin", "hayes", "myers",
-            "hamilton", "graham", "sullivan", "wallace", "cole", "west", "reynolds", "fisher",
-            "ellis", "harrison", "gibson", "wells", "webb", "simpson", "stevens", "porter"
-        }
+        return set(COMMON_LAST_NAMES)
     
     def _load_custom_exceptions(self) -> Dict[str, Set[str]]:
-        """Load custom exceptions for names to always include or exclude."""
+        """Load custom exceptions for names to always include or exclude.
+        
+        The parsed file is kept in self._exceptions_doc so that
+        add_custom_exception can update it in memory; flush_exceptions
+        writes it back.
+        """
         exceptions_file = self.script_dir / "name_exceptions.json"
+        self._exceptions_doc = None
+        self._exceptions_dirty = False
         
         if not exceptions_file.exists():
             # Create default exceptions file
@@ -214,19 +290,20 @@ class NameValidator:
                 "always_exclude": []
             }
             
-            with open(exceptions_file, 'w', encoding='utf-8') as f:
-                json.dump(default_exceptions, f, indent=4)
+            exceptions_file.write_bytes(_json_dumps(default_exceptions))
             
+            self._exceptions_doc = default_exceptions
             return {"include": set(), "exclude": set()}
         else:
             try:
-                with open(exceptions_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = _json_loads(exceptions_file.read_bytes())
                 
-                return {
+                exceptions = {
                     "include": set(name.lower().replace(" ", "_") for name in data.get("always_include", [])),
                     "exclude": set(name.lower().replace(" ", "_") for name in data.get("always_exclude", []))
                 }
+                self._exceptions_doc = data
+                return exceptions
             except Exception as e:
                 logger.error(f"Error loading custom exceptions: {e}")
                 return {"include": set(), "exclude": set()}
@@ -283,8 +360,7 @@ class NameValidator:
             file_path = self.script_dir / filename
             if file_path.exists():
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    data = _json_loads(file_path.read_bytes())
                     
                     if isinstance(data, list) and data:
                         logger.info(f"Loaded {len(data)} employees from {filename}")
@@ -304,21 +380,14 @@ class NameValidator:
         if len(first_name) > 25 or len(last_name) > 30:
             return ValidationResult(False, "too_long", 0.0)
         
-        # Character validation
-        if not re.match(r"^[a-zA-Z\-']+$", first_name) or not re.match(r"^[a-zA-Z\-']+$", last_name):
+        # Character validation; this also rejects any name containing digits
+        if not NAME_CHARS_RE.match(first_name) or not NAME_CHARS_RE.match(last_name):
             return ValidationResult(False, "invalid_characters", 0.0)
         
-        # Check for numbers
-        if any(c.isdigit() for c in first_name + last_name):
-            return ValidationResult(False, "contains_numbers", 0.0)
-        
         return ValidationResult(True, "structure_valid", 0.7)
     
-    def _validate_against_databases(self, first_name: str, last_name: str) -> ValidationResult:
-        """Validate names against common name databases."""
-        first_lower = first_name.lower()
-        last_lower = last_name.lower()
-        
+    def _validate_against_databases(self, first_lower: str, last_lower: str) -> ValidationResult:
+        """Validate lowercased names against common name databases."""
         first_in_db = first_lower in self.common_first_names
         last_in_db = last_lower in self.common_last_names
         
@@ -329,14 +398,22 @@ class NameValidator:
         else:
             return ValidationResult(True, "not_in_database", 0.3)
     
-    def _validate_with_nlp(self, first_name: str, last_name: str) -> ValidationResult:
-        """Use NLP model to validate names."""
+    def _validate_with_nlp(self, first_name: str, last_name: str, doc=None) -> ValidationResult:
+        """Use NLP model to validate names.
+        
+        doc is the model's parse of "first last" when it was already batched.
+        """
         if not self.nlp_model:
+            if self.nlp_backend == 'rules':
+                if first_name[0].isupper() and last_name[0].isupper():
+                    return ValidationResult(True, "proper_noun_pattern", 0.6)
+                return ValidationResult(True, "not_capitalized", 0.4)
             return ValidationResult(True, "nlp_unavailable", 0.5)
         
         try:
             full_name = f"{first_name} {last_name}"
-            doc = self.nlp_model(full_name)
+            if doc is None:
+                doc = self.nlp_model(full_name)
             
             # Check if recognized as a person
             for ent in doc.ents:
@@ -359,43 +436,50 @@ class NameValidator:
             logger.debug(f"NLP validation error: {e}")
             return ValidationResult(True, "nlp_error", 0.5)
     
-    def _check_false_positives(self, first_name: str, last_name: str) -> ValidationResult:
-        """Check against known false positives."""
-        first_lower = first_name.lower()
-        last_lower = last_name.lower()
-        
+    def _check_false_positives(self, first_lower: str, last_lower: str) -> ValidationResult:
+        """Check lowercased names against known false positives."""
         if first_lower in self.false_positives or last_lower in self.false_positives:
             return ValidationResult(False, "known_false_positive", 0.0)
         
         # Check for location patterns
-        full_name = f"{first_name} {last_name}"
-        location_patterns = [
-            r'\b[A-Z][a-z]+ (?:Street|Road|Avenue|Lane|Drive|Place|Square|Terrace|Gardens|Park|Close|Way|Court|Crescent)\b',
-            r'\b[A-Z][a-z]+ (?:Row|Mews|Circle|Heights|Hill|Estate|Acres|Bridge|Village|Gate|Cross|Plaza|Yard|Wharf|Quay)\b'
-        ]
-        
-        for pattern in location_patterns:
-            if re.search(pattern, full_name, re.IGNORECASE):
-                return ValidationResult(False, "location_pattern", 0.0)
+        if LOCATION_PATTERN_RE.search(f"{first_lower} {last_lower}"):
+            return ValidationResult(False, "location_pattern", 0.0)
         
         return ValidationResult(True, "no_false_positive", 0.8)
     
-    def _check_custom_exceptions(self, first_name: str, last_name: str) -> Optional[ValidationResult]:
-        """Check custom exceptions for manual overrides."""
-        name_key = f"{first_name.lower()}_{last_name.lower()}"
+    def _check_custom_exceptions(self, first_lower: str, last_lower: str) -> Optional[ValidationResult]:
+        """Check custom exceptions for manual overrides of lowercased names."""
+        include = self.custom_exceptions["include"]
+        exclude = self.custom_exceptions["exclude"]
+        
+        # Usually there are no exceptions at all; skip building the key
+        if not include and not exclude:
+            return None
         
-        if name_key in self.custom_exceptions["include"]:
+        name_key = f"{first_lower}_{last_lower}"
+        
+        if name_key in include:
             return ValidationResult(True, "custom_include", 1.0)
         
-        if name_key in self.custom_exceptions["exclude"]:
+        if name_key in exclude:
             return ValidationResult(False, "custom_exclude", 0.0)
         
         return None
     
-    def validate_name(self, first_name: str, last_name: str) -> ValidationResult:
-        """Comprehensive name validation using multiple methods."""
+    def _prevalidate_name(self, first_name: str, last_name: str
+                          ) -> Union[ValidationResult, Tuple[ValidationResult, ValidationResult, ValidationResult]]:
+        """Run the validation checks that need no NLP model.
+        
+        Returns the final result when these checks settle the name, otherwise
+        the structure, false positive and database results for _score_name.
+        """
+        # The exception, false positive and database checks all compare
+        # lowercased names, so lowercase once for all three
+        first_lower = first_name.lower()
+        last_lower = last_name.lower()
+        
         # Check custom exceptions first
-        custom_result = self._check_custom_exceptions(first_name, last_name)
+        custom_result = self._check_custom_exceptions(first_lower, last_lower)
         if custom_result:
             return custom_result
         
@@ -405,15 +489,26 @@ class NameValidator:
             return structure_result
         
         # False positive check
-        fp_result = self._check_false_positives(first_name, last_name)
+        fp_result = self._check_false_positives(first_lower, last_lower)
         if not fp_result.is_valid:
             return fp_result
         
         # Database validation
-        db_result = self._validate_against_databases(first_name, last_name)
+        db_result = self._validate_against_databases(first_lower, last_lower)
+        
+        return structure_result, fp_result, db_result
+    
+    def _score_name(self, first_name: str, last_name: str,
+                    partial: Tuple[ValidationResult, ValidationResult, ValidationResult],
+                    doc=None) -> ValidationResult:
+        """Combine the results of _prevalidate_name with the NLP check.
+        
+        doc is the model's parse of "first last" when it was already batched.
+        """
+        structure_result, fp_result, db_result = partial
         
         # NLP validation
-        nlp_result = self._validate_with_nlp(first_name, last_name)
+        nlp_result = self._validate_with_nlp(first_name, last_name, doc)
         
         # Combine results with weighted scoring
         confidence_score = (
@@ -427,9 +522,7 @@ class NameValidator:
         is_valid = confidence_score >= 0.5
         
         # Determine primary reason
-        if db_result.reason == "both_in_database":
-            reason = "database_match"
-        elif nlp_result.reason == "nlp_person_entity":
+        if nlp_result.reason == "nlp_person_entity":
             reason = "nlp_confirmed"
         elif db_result.reason == "partial_database_match":
             reason = "partial_match"
@@ -438,41 +531,112 @@ class NameValidator:
         
         return ValidationResult(is_valid, reason, confidence_score)
     
+    def _parse_names(self, names: List[Tuple[str, str]]) -> List:
+        """Run the NLP model over names in batches.
+        
+        Returns one doc per name, or None for every name when there is no
+        model or the batch failed; _score_name then parses each name alone.
+        """
+        docs = [None] * len(names)
+        if not self.nlp_model:
+            return docs
+        
+        texts = (f"{first_name} {last_name}" for first_name, last_name in names)
+        try:
+            for i, doc in enumerate(self.nlp_model.pipe(texts, batch_size=NLP_BATCH_SIZE)):
+                docs[i] = doc
+        except Exception as e:
+            logger.debug(f"Batch NLP validation error: {e}")
+        
+        return docs
+    
+    def _validate_names(self, names: List[Tuple[str, str]]):
+        """Validate many names into the validation cache.
+        
+        Each distinct name goes through _prevalidate_name once, and only the
+        names it leaves undecided are parsed by the NLP model, in batches.
+        """
+        pending: Dict[Tuple[str, str], Tuple[ValidationResult, ValidationResult, ValidationResult]] = {}
+        for key in names:
+            if key in self._validation_cache or key in pending:
+                continue
+            stage = self._prevalidate_name(*key)
+            if isinstance(stage, ValidationResult):
+                self._validation_cache[key] = stage
+            else:
+                pending[key] = stage
+        
+        docs = self._parse_names(list(pending))
+        for ((first_name, last_name), partial), doc in zip(pending.items(), docs):
+            self._validation_cache[(first_name, last_name)] = self._score_name(first_name, last_name, partial, doc)
+    
+    def validate_name(self, first_name: str, last_name: str, doc=None) -> ValidationResult:
+        """Comprehensive name validation using multiple methods.
+        
+        doc is an optional pre-computed NLP parse of "first last".
+        """
+        key = (first_name, last_name)
+        cached = self._validation_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        stage = self._prevalidate_name(first_name, last_name)
+        if isinstance(stage, ValidationResult):
+            result = stage
+        else:
+            result = self._score_name(first_name, last_name, stage, doc)
+        self._validation_cache[key] = result
+        return result
+    
     def add_custom_exception(self, first_name: str, last_name: str, include: bool = True):
-        """Add a name to the custom exceptions list."""
+        """Add a name to the custom exceptions list.
+        
+        The change is made in memory; call flush_exceptions to save it.
+        """
         name_key = f"{first_name.lower()}_{last_name.lower()}"
-        exceptions_file = self.script_dir / "name_exceptions.json"
+        
+        # Cached results may no longer match the updated exceptions
+        self._validation_cache.clear()
+        
+        if include:
+            self.custom_exceptions["include"].add(name_key)
+            self.custom_exceptions["exclude"].discard(name_key)
+        else:
+            self.custom_exceptions["exclude"].add(name_key)
+            self.custom_exceptions["include"].discard(name_key)
+        
+        if self._exceptions_doc is None:
+            # The exceptions file could not be read; do not overwrite it
+            return
+        
+        # Add to appropriate list
+        full_name = f"{first_name} {last_name}"
+        always_include = self._exceptions_doc.setdefault("always_include", [])
+        always_exclude = self._exceptions_doc.setdefault("always_exclude", [])
+        if include:
+            if full_name not in always_include:
+                always_include.append(full_name)
+            # Remove from exclude list if present
+            if full_name in always_exclude:
+                always_exclude.remove(full_name)
+        else:
+            if full_name not in always_exclude:
+                always_exclude.append(full_name)
+            # Remove from include list if present
+            if full_name in always_include:
+                always_include.remove(full_name)
+        
+        self._exceptions_dirty = True
+    
+    def flush_exceptions(self):
+        """Save custom exceptions added since the last flush."""
+        if not self._exceptions_dirty:
+            return
         
         try:
-            # Load current exceptions
-            with open(exceptions_file, 'r', encoding='utf-8') as f:
-                exceptions = json.load(f)
-            
-            # Add to appropriate list
-            full_name = f"{first_name} {last_name}"
-            if include:
-                if full_name not in exceptions["always_include"]:
-                    exceptions["always_include"].append(full_name)
-                # Remove from exclude list if present
-                if full_name in exceptions["always_exclude"]:
-                    exceptions["always_exclude"].remove(full_name)
-                
-                self.custom_exceptions["include"].add(name_key)
-                self.custom_exceptions["exclude"].discard(name_key)
-            else:
-                if full_name not in exceptions["always_exclude"]:
-                    exceptions["always_exclude"].append(full_name)
-                # Remove from include list if present
-                if full_name in exceptions["always_include"]:
-                    exceptions["always_include"].remove(full_name)
-                
-                self.custom_exceptions["exclude"].add(name_key)
-                self.custom_exceptions["include"].discard(name_key)
-            
-            # Save updated exceptions
-            with open(exceptions_file, 'w', encoding='utf-8') as f:
-                json.dump(exceptions, f, indent=4)
-            
+            exceptions_file = self.script_dir / "name_exceptions.json"
+            exceptions_file.write_bytes(_json_dumps(self._exceptions_doc))
+            self._exceptions_dirty = False
         except Exception as e:
             logger.error(f"Error updating custom exceptions: {e}")
     
@@ -488,7 +652,8 @@ class NameValidator:
         uncertain_employees = []
         invalid_employees = []
         
-        # First pass - automatic validation
+        # Collect the names to validate
+        named_employees = []
         for employee in self.employees:
             first_name = employee.get('first_name', '').strip()
             last_name = employee.get('last_name', '').strip()
@@ -496,6 +661,14 @@ class NameValidator:
             if not first_name or not last_name:
                 continue
             
+            named_employees.append((employee, first_name, last_name))
+        
+        # Validate every distinct name up front, batching the NLP model
+        # rather than calling it once per name
+        self._validate_names([(first, last) for _, first, last in named_employees])
+        
+        # First pass - automatic validation
+        for employee, first_name, last_name in named_employees:
             result = self.validate_name(first_name, last_name)
             
             if result.is_valid and result.confidence >= 0.7:
@@ -513,9 +686,13 @@ class NameValidator:
         # Handle uncertain employees interactively if requested
         if interactive and uncertain_employees:
             logger.info("Reviewing uncertain names...")
-            final_employees.extend(
-                self._review_uncertain_names(uncertain_employees)
-            )
+            try:
+                final_employees.extend(
+                    self._review_uncertain_names(uncertain_employees)
+                )
+            finally:
+                # Save the answers given, even if the review was interrupted
+                self.flush_exceptions()
         elif uncertain_employees:
             # If not interactive, include uncertain employees
             final_employees.extend([emp for emp, _ in uncertain_employees])
@@ -561,16 +738,19 @@ class NameValidator:
     
     def save_validated_data(self, validated_employees: List[Dict]) -> bool:
         """Save validated employee data."""
+        self.flush_exceptions()
+        
         try:
+            # Serialise once; both files get the same bytes
+            payload = _json_dumps(validated_employees)
+            
             # Save to validated output file
             output_path = self.script_dir / self.validated_output_file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(validated_employees, f, indent=4, ensure_ascii=False)
+            output_path.write_bytes(payload)
             
             # Also update the main verified data file
             verified_path = self.script_dir / self.verified_data_file
-            with open(verified_path, 'w', encoding='utf-8') as f:
-                json.dump(validated_employees, f, indent=4, ensure_ascii=False)
+            verified_path.write_bytes(payload)
             
             logger.info(f"Validated data saved to {self.validated_output_file} and {self.verified_data_file}")
             logger.info(f"Saved {len(validated_employees)} validated employees")
@@ -593,12 +773,10 @@ class NameValidator:
                 import openpyxl
                 from openpyxl.styles import Font, PatternFill, Alignment
             
-            logger.info("Creating validation report...")
+            from openpyxl.cell import WriteOnlyCell
+            from openpyxl.utils import get_column_letter
             
-            # Create workbook
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "Validated Employees"
+            logger.info("Creating validation report...")
             
             # Headers
             headers = [
@@ -606,67 +784,79 @@ class NameValidator:
                 "Source", "Confidence", "Link", "Location"
             ]
             
+            # Flatten employees into rows, tracking the widest value per column
+            # on the way; write-only sheets need widths before the first row
+            max_lengths = [len(header) for header in headers]
+            rows = []
+            for emp in validated_employees:
+                row = (emp.get('first_name', ''), emp.get('last_name', ''), emp.get('title', ''),
+                       emp.get('source', ''), emp.get('confidence', '').upper(),
+                       emp.get('link', '') or emp.get('source_link', ''), emp.get('location', ''))
+                for col, value in enumerate(row):
+                    length = len(str(value))
+                    if length > max_lengths[col]:
+                        max_lengths[col] = length
+                rows.append(row)
+            
+            # Create workbook; write-only mode streams rows instead of keeping
+            # every cell in memory
+            wb = openpyxl.Workbook(write_only=True)
+            ws = wb.create_sheet("Validated Employees")
+            
+            for col, max_length in enumerate(max_lengths, 1):
+                ws.column_dimensions[get_column_letter(col)].width = min(max_length + 2, 50)
+            
+            # Style objects are created once and shared by every cell that uses them
+            header_font = Font(bold=True, color="FFFFFF")
+            header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+            header_alignment = Alignment(horizontal="center")
+            link_font = Font(color="0000FF", underline="single")
+            confidence_fills = {
+                'HIGH': PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid"),
+                'MEDIUM': PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid"),
+            }
+            low_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+            bold_font = Font(bold=True)
+            
             # Write headers with styling
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col, value=header)
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.alignment = Alignment(horizontal="center")
-            
-            # Write employee data
-            for row, emp in enumerate(validated_employees, 2):
-                ws.cell(row=row, column=1, value=emp.get('first_name', ''))
-                ws.cell(row=row, column=2, value=emp.get('last_name', ''))
-                ws.cell(row=row, column=3, value=emp.get('title', ''))
-                ws.cell(row=row, column=4, value=emp.get('source', ''))
-                
+            header_row = []
+            for header in headers:
+                cell = WriteOnlyCell(ws, value=header)
+                cell.font = header_font
+                cell.fill = header_fill
+                cell.alignment = header_alignment
+                header_row.append(cell)
+            ws.append(header_row)
+            
+            # Write employee data; only the two styled columns need cell objects
+            for first_name, last_name, title, source, confidence, link, location in rows:
                 # Confidence with color coding
-                conf_cell = ws.cell(row=row, column=5, value=emp.get('confidence', '').upper())
-                if conf_cell.value == 'HIGH':
-                    conf_cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-                elif conf_cell.value == 'MEDIUM':
-                    conf_cell.fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-                else:
-                    conf_cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+                conf_cell = WriteOnlyCell(ws, value=confidence)
+                conf_cell.fill = confidence_fills.get(confidence, low_fill)
                 
                 # Link with hyperlink
-                link = emp.get('link', '') or emp.get('source_link', '')
-                link_cell = ws.cell(row=row, column=6, value=link)
+                link_cell = WriteOnlyCell(ws, value=link)
                 if link:
                     link_cell.hyperlink = link
-                    link_cell.font = Font(color="0000FF", underline="single")
+                    link_cell.font = link_font
                 
-                ws.cell(row=row, column=7, value=emp.get('location', ''))
-            
-            # Auto-adjust column widths
-            for col in ws.columns:
-                max_length = 0
-                column = col[0].column_letter
-                for cell in col:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column].width = adjusted_width
+                ws.append([first_name, last_name, title, source, conf_cell, link_cell, location])
             
             # Add validation summary sheet
             summary_sheet = wb.create_sheet(title="Validation Summary")
-            summary_sheet["A1"] = "Validation Report"
-            summary_sheet["A1"].font = Font(bold=True, size=14)
-            
-            summary_sheet["A3"] = "Company"
-            summary_sheet["B3"] = self.config.get('company_name', '')
-            summary_sheet["A4"] = "Location"
-            summary_sheet["B4"] = self.config.get('location', '')
-            summary_sheet["A5"] = "Total Validated Employees"
-            summary_sheet["B5"] = len(validated_employees)
-            summary_sheet["A6"] = "Validation Date"
-            summary_sheet["B6"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            summary_sheet["A7"] = "Name Validation Applied"
-            summary_sheet["B7"] = "Yes"
+            
+            def bold(value, font=bold_font):
+                cell = WriteOnlyCell(summary_sheet, value=value)
+                cell.font = font
+                return cell
+            
+            summary_sheet.append([bold("Validation Report", Font(bold=True, size=14))])
+            summary_sheet.append([])
+            summary_sheet.append(["Company", self.config.get('company_name', '')])
+            summary_sheet.append(["Location", self.config.get('location', '')])
+            summary_sheet.append(["Total Validated Employees", len(validated_employees)])
+            summary_sheet.append(["Validation Date", datetime.now().strftime("%Y-%m-%d %H:%M:%S")])
+            summary_sheet.append(["Name Validation Applied", "Yes"])
             
             # Statistics
             sources = {}
@@ -686,35 +876,24 @@ class NameValidator:
                     linkedin_count += 1
             
             # Add source breakdown
-            row = 9
-            summary_sheet[f"A{row}"] = "Sources:"
-            summary_sheet[f"A{row}"].font = Font(bold=True)
-            row += 1
+            summary_sheet.append([])
+            summary_sheet.append([bold("Sources:")])
             
             for source, count in sorted(sources.items(), key=lambda x: x[1], reverse=True):
-                summary_sheet[f"A{row}"] = f"  {source}"
-                summary_sheet[f"B{row}"] = count
-                row += 1
+                summary_sheet.append([f"  {source}", count])
             
             # Add confidence breakdown
-            row += 1
-            summary_sheet[f"A{row}"] = "Confidence Levels:"
-            summary_sheet[f"A{row}"].font = Font(bold=True)
-            row += 1
+            summary_sheet.append([])
+            summary_sheet.append([bold("Confidence Levels:")])
             
             for conf, count in sorted(confidence_levels.items()):
-                summary_sheet[f"A{row}"] = f"  {conf.title()}"
-                summary_sheet[f"B{row}"] = count
-                row += 1
+                summary_sheet.append([f"  {conf.title()}", count])
             
             # Add LinkedIn info
             if linkedin_count > 0:
-                row += 1
-                summary_sheet[f"A{row}"] = "LinkedIn Profiles Available:"
-                summary_sheet[f"A{row}"].font = Font(bold=True)
-                row += 1
-                summary_sheet[f"A{row}"] = f"  Ready for verification"
-                summary_sheet[f"B{row}"] = linkedin_count
+                summary_sheet.append([])
+                summary_sheet.append([bold("LinkedIn Profiles Available:")])
+                summary_sheet.append([f"  Ready for verification", linkedin_count])
             
             # Save Excel file
             company_name = self.config.get('company_name', 'Company').replace(' ', '_')